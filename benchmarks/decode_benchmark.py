@@ -0,0 +1,151 @@
+"""
+Decode benchmark: raw response.json() dicts vs msgspec-decoded response models.
+
+Builds synthetic DexHunter trending lists and Koios address UTXO sets shaped like
+the real payloads (including the fields we never read), then compares decode
+time and retained memory of the two paths. It also times the production
+DexHunterService.get_trending path (decode, shared-cache write, cache hit) with
+the HTTP call replaced by the synthetic body. No network calls are made.
+
+Usage:
+    python benchmarks/decode_benchmark.py [--pairs 5000] [--utxos 20000] [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the benchmark's cache entries out of the bot's shared cache
+os.environ["SHARED_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(), "decode_benchmark.db")
+
+from src.bot.models.base import decode_json  # noqa: E402
+from src.bot.services import dex_service  # noqa: E402
+from src.bot.utils.shared_cache import shared_cache  # noqa: E402
+from src.bot.models.dexhunter import TrendingPair  # noqa: E402
+from src.bot.models.koios import AddressInfo  # noqa: E402
+
+
+def trending_payload(count):
+    return json.dumps([
+        {
+            "token_id": f"{i:056x}534e454b",
+            "current_period_volume": 1234.5 + i,
+            "previous_period_volume": 1000.25 + i,
+            "volume_change_percentage": 12.5,
+            "current_period_closing_price": 0.00123 + i / 1e6,
+            "previous_period_closing_price": 0.00111,
+            "price_change_percentage": -3.2,
+            "amount_buys": i % 97,
+            "amount_sales": i % 89,
+            "unique_buyers": i % 13,
+            "unique_sellers": i % 11,
+            "token_ascii": "SNEK",
+            "ticker": "SNEK",
+            "is_verified": True,
+            "logo": "https://example.invalid/logo.png",
+            "market_cap": 123456789.0
+        }
+        for i in range(count)
+    ]).encode()
+
+
+def address_payload(count):
+    return json.dumps([{
+        "address": "addr1qxy",
+        "balance": "123456789",
+        "stake_address": "stake1uxy",
+        "script_address": False,
+        "utxo_set": [
+            {
+                "tx_hash": f"{i:064x}",
+                "tx_index": i % 4,
+                "block_height": 10_000_000 + i,
+                "block_time": 1_700_000_000 + i,
+                "value": str(1_500_000 + i),
+                "datum_hash": None,
+                "inline_datum": None,
+                "reference_script": None,
+                "asset_list": [
+                    {
+                        "policy_id": f"{i:056x}",
+                        "asset_name": "534e454b",
+                        "fingerprint": "asset1xyz",
+                        "decimals": 0,
+                        "quantity": str(1000 + i)
+                    }
+                ]
+            }
+            for i in range(count)
+        ]
+    }]).encode()
+
+
+def dict_path(body):
+    return json.loads(body)
+
+
+def model_path(model_type):
+    return lambda body: decode_json(model_type, body)
+
+
+def service_path(cache_hit):
+    def run(body):
+        dex_service.requests.post = lambda *args, **kwargs: types.SimpleNamespace(
+            content=body, raise_for_status=lambda: None
+        )
+        if not cache_hit:
+            shared_cache.delete("dexhunter:trending:5m")
+        return dex_service.DexHunterService.get_trending("5m")
+    return run
+
+
+def measure(decode, body, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode(body)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    result = decode(body)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), retained / 1024 / 1024, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=5000)
+    parser.add_argument("--utxos", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'payload':<22} {'path':<8} {'time ms':>9} {'retained MB':>12} {'peak MB':>9}")
+    cases = [
+        (f"trending x{args.pairs}", trending_payload(args.pairs), list[TrendingPair]),
+        (f"utxo_set x{args.utxos}", address_payload(args.utxos), list[AddressInfo]),
+    ]
+    for name, body, model in cases:
+        for path, decode in (("dict", dict_path), ("model", model_path(model))):
+            ms, retained, peak = measure(decode, body, args.runs)
+            print(f"{name:<22} {path:<8} {ms:>9.1f} {retained:>12.2f} {peak:>9.2f}")
+
+    # End to end service path, as /trending runs it; compare with the "dict" row above
+    body = cases[0][1]
+    print()
+    print(f"{'get_trending x' + str(args.pairs):<22} {'path':<8} {'time ms':>9} {'retained MB':>12} {'peak MB':>9}")
+    for path, decode in (("miss", service_path(False)), ("hit", service_path(True))):
+        ms, retained, peak = measure(decode, body, args.runs)
+        print(f"{'':<22} {path:<8} {ms:>9.1f} {retained:>12.2f} {peak:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Startup-time benchmark: time-to-first-reply of a freshly started bot process.
+
+Each run starts a new interpreter (cold imports) and goes through main.main(),
+including the background services it starts. Once the bot would start polling,
+it is fed a /start update, the time of the reply is recorded, and the token
+registry is loaded as a /trending lookup would. HTTP requests fail immediately
+instead of reaching the network, and the shared cache lives in a temp directory.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, os, time
+t0 = time.perf_counter()
+
+import requests
+from telebot import TeleBot, types
+
+def offline(*args, **kwargs):
+    raise requests.exceptions.ConnectionError("benchmark: network disabled")
+requests.Session.request = offline
+
+replies = []
+def record(self, chat_id, *args, **kwargs):
+    replies.append(time.perf_counter())
+TeleBot.send_message = record
+TeleBot.reply_to = lambda self, message, *args, **kwargs: record(self, message.chat.id)
+
+def serve(self, *args, **kwargs):
+    t_serving = time.perf_counter()
+    self.threaded = False
+    self.process_new_updates([types.Update.de_json({
+        "update_id": 1,
+        "message": {
+            "message_id": 1, "date": 0, "text": "/start",
+            "chat": {"id": 1, "type": "private"},
+            "from": {"id": 1, "is_bot": False, "first_name": "bench"},
+            "entities": [{"type": "bot_command", "offset": 0, "length": 6}]
+        }
+    })])
+    t_reply = replies[0]
+
+    from src.bot.utils.mapping_token_name import FormatTokenName
+    FormatTokenName.load_token_name()
+    t_tokens = time.perf_counter()
+
+    print(json.dumps({
+        "serving_ms": (t_serving - t0) * 1000,
+        "first_reply_ms": (t_reply - t0) * 1000,
+        "token_registry_ms": (t_tokens - t_reply) * 1000
+    }), flush=True)
+    os._exit(0)
+TeleBot.infinity_polling = serve
+
+import main
+main.main()
+"""
+
+
+def run_once(lazy, snapshot):
+    from config.settings import TOKENS_SNAPSHOT_PATH
+
+    if snapshot:
+        subprocess.run([sys.executable, "-m", "src.bot.utils.mapping_token_name"],
+                       cwd=ROOT, check=True, capture_output=True)
+    elif os.path.exists(TOKENS_SNAPSHOT_PATH):
+        os.remove(TOKENS_SNAPSHOT_PATH)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ, API_KEY_TELEGRAM="123456:benchmark", BOT_MODE="polling",
+            SHARED_CACHE_PATH=os.path.join(tmp, "shared_cache.db"),
+            # Eager: import everything up front and start the background services before serving
+            LAZY_IMPORTS="1" if lazy else "0", BACKGROUND_SERVICES_DELAY="2" if lazy else "0"
+        )
+        output = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env,
+                                check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    modes = [
+        ("eager imports, tokens.json", False, False),
+        ("lazy imports, snapshot", True, True),
+    ]
+
+    print(f"{'mode':<28} {'serving':>9} {'1st reply':>10} {'tokens':>9}  (median ms, {args.runs} runs)")
+    for name, lazy, snapshot in modes:
+        runs = [run_once(lazy, snapshot) for _ in range(args.runs)]
+        median = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        print(f"{name:<28} {median['serving_ms']:>9.1f} {median['first_reply_ms']:>10.1f} "
+              f"{median['token_registry_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
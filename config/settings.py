@@ -5,11 +5,28 @@ load_dotenv()
 
 # Bot Configuration
 BOT_TOKEN = os.getenv('API_KEY_TELEGRAM')
+BOT_NUM_THREADS = int(os.getenv('BOT_NUM_THREADS', 16))
+
+# Startup: defer importing heavy API clients until first use
+LAZY_IMPORTS = os.getenv('LAZY_IMPORTS', '1') == '1'
+# Seconds after startup before the channel worker and token sync are imported and started (0: before serving)
+BACKGROUND_SERVICES_DELAY = float(os.getenv('BACKGROUND_SERVICES_DELAY', 2))
+
+# Token registry and its precompiled binary snapshot
+TOKENS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "bot", "tokens.json")
+TOKENS_SNAPSHOT_PATH = os.getenv('TOKENS_SNAPSHOT_PATH', TOKENS_PATH.replace(".json", ".snapshot"))
+
+# Inline mode: results returned per @bot search
+INLINE_RESULTS_LIMIT = int(os.getenv('INLINE_RESULTS_LIMIT', 20))
 
 # API Configuration
 DEXHUNTER_API_URL = "https://api-us.dexhunterv3.app"
 KOIOS_API_URL = "https://api.koios.rest/api/v1"
 COINGECKO_API_URL = "https://api.coingecko.com/api/v3"
+DEXHUNTER_TOKENS_URL = f"{DEXHUNTER_API_URL}/swap/tokens"
+
+# Token registry background sync interval in seconds (0 disables it)
+TOKEN_SYNC_INTERVAL = int(os.getenv('TOKEN_SYNC_INTERVAL', 900))
 
 # Default Headers
 DEXHUNTER_HEADERS = {
@@ -18,10 +35,86 @@ DEXHUNTER_HEADERS = {
     "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 }
 
+# DexHunter swap routing
+DEXHUNTER_DEXES = [
+    "MINSWAP", "MINSWAPV2", "SUNDAESWAP", "SUNDAESWAPV3", "WINGRIDERS", "WINGRIDERSV2",
+    "SPECTRUM", "SPLASH", "VYFI", "CERRA", "MUESLISWAP", "GENIUS", "CHADSWAP", "SNEKFUN"
+]
+DEXHUNTER_BLACKLISTED_DEXES = ["CERRA", "MUESLISWAP", "GENIUS"]
+
+# DEXes quoted side by side in /estimate: {label: DEXes the quote may route through}
+ESTIMATE_COMPARE_DEXES = {
+    "Minswap": ["MINSWAP", "MINSWAPV2"],
+    "SundaeSwap": ["SUNDAESWAP", "SUNDAESWAPV3"],
+    "WingRiders": ["WINGRIDERS", "WINGRIDERSV2"],
+    "Spectrum": ["SPECTRUM"],
+    "Splash": ["SPLASH"],
+    "VyFi": ["VYFI"]
+}
+ESTIMATE_CACHE_TTL = float(os.getenv('ESTIMATE_CACHE_TTL', 10))
+# Seconds before a single DexHunter request gives up (keep well under LEADER_LEASE_TTL - 60 for the
+# channel worker), and before /estimate replies without the missing quotes
+DEXHUNTER_TIMEOUT = float(os.getenv('DEXHUNTER_TIMEOUT', 10))
+ESTIMATE_TIMEOUT = float(os.getenv('ESTIMATE_TIMEOUT', 12))
+# DEX comparisons quoted at once per process, later ones wait briefly for a slot or are turned away
+ESTIMATE_MAX_CONCURRENT = int(os.getenv('ESTIMATE_MAX_CONCURRENT', 4))
+
+# /ladder: ADA trade sizes quoted locally from pool snapshots refreshed every LADDER_POOL_TTL seconds
+LADDER_AMOUNTS = [100, 1_000, 10_000, 100_000]
+LADDER_PROBE_AMOUNT = 1_000
+LADDER_POOL_TTL = float(os.getenv('LADDER_POOL_TTL', 60))
+
 KOIOS_HEADERS = {
     "accept": "application/json",
     "content-type": "application/json"
 }
 
+# Concurrent Koios/CoinGecko lookups are collected for BATCH_WINDOW seconds into one bulk call
+BATCH_WINDOW = float(os.getenv('BATCH_WINDOW', 0.005))
+BATCH_MAX_SIZE = int(os.getenv('BATCH_MAX_SIZE', 100))
+# Seconds before a Koios/CoinGecko request gives up, and before a batched caller stops waiting for its batch
+UPSTREAM_TIMEOUT = float(os.getenv('UPSTREAM_TIMEOUT', 10))
+BATCH_WAIT_TIMEOUT = float(os.getenv('BATCH_WAIT_TIMEOUT', 15))
+
 # Chanel ID
-CHANNEL_ID = "@cardano_hunter"
\ No newline at end of file
+CHANNEL_ID = "@cardano_hunter"
+
+# Throttling: token bucket refill rate (requests per second) and burst size
+THROTTLE_USER_RATE = float(os.getenv('THROTTLE_USER_RATE', 0.5))
+THROTTLE_USER_BURST = int(os.getenv('THROTTLE_USER_BURST', 5))
+THROTTLE_CHAT_RATE = float(os.getenv('THROTTLE_CHAT_RATE', 2))
+THROTTLE_CHAT_BURST = int(os.getenv('THROTTLE_CHAT_BURST', 20))
+
+# Identical commands from the same chat within this many seconds run only once
+DUPLICATE_COMMAND_WINDOW = float(os.getenv('DUPLICATE_COMMAND_WINDOW', 5))
+# A command still running after this many seconds is considered hung and no longer collapses repeats
+DUPLICATE_COMMAND_MAX_IN_FLIGHT = float(os.getenv('DUPLICATE_COMMAND_MAX_IN_FLIGHT', 60))
+
+# Deployment: "polling" (single process) or "webhook" (sharded across WORKER_PROCESSES)
+BOT_MODE = os.getenv('BOT_MODE', 'polling')
+WORKER_PROCESSES = int(os.getenv('WORKER_PROCESSES', 4))
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+WEBHOOK_LISTEN = os.getenv('WEBHOOK_LISTEN', '0.0.0.0')
+WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', 8443))
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+
+# Cache shared by all bot processes on the host, and the lease that elects the channel worker
+SHARED_CACHE_PATH = os.getenv('SHARED_CACHE_PATH', 'cardano_bot_cache.db')
+SHARED_CACHE_TTL = float(os.getenv('SHARED_CACHE_TTL', 30))
+LEADER_LEASE_TTL = float(os.getenv('LEADER_LEASE_TTL', 90))
+
+# Charts: rendered in a process pool, uploaded once per data version and re-sent by Telegram file_id
+CHARTS_ENABLED = os.getenv('CHARTS_ENABLED', '1') == '1'
+CHART_RENDER_WORKERS = int(os.getenv('CHART_RENDER_WORKERS', 2))
+CHART_FILE_ID_TTL = float(os.getenv('CHART_FILE_ID_TTL', 86400))
+TRENDING_CHART_TOKENS = 10
+
+# Samples kept for charts: one fear & greed value per worker run, one trending sample per refresh
+FEAR_GREED_HISTORY_SIZE = 1440
+TRENDING_HISTORY_SIZE = 120
+TRENDING_HISTORY_MAX_AGE = 86400
+
+# Epoch history for /epoch_range: bulk-fetched from Koios into a local column snapshot
+EPOCH_HISTORY_PATH = os.getenv('EPOCH_HISTORY_PATH', 'epoch_history.snapshot')
+EPOCH_HISTORY_REFRESH = float(os.getenv('EPOCH_HISTORY_REFRESH', 3600))
+EPOCH_HISTORY_PAGE_SIZE = 1000  # Koios returns at most 1000 rows per request
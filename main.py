@@ -1,16 +1,22 @@
-from src.bot.bot import create_bot
-from src.bot.services.worker_service import WorkerService
+from config.settings import BOT_MODE
+from src.bot.bot import create_bot, start_background_services
 
 
 def main():
+    if BOT_MODE == "webhook":
+        from src.bot.webhook import WebhookServer
+
+        print("Bot started in webhook mode...")
+        WebhookServer().serve_forever()
+        return
+
     bot = create_bot()
 
-    # WorkerServcie
-    worker = WorkerService(bot)
-    worker.start()
+    # Fear & greed channel worker and token registry sync, started once the bot is serving
+    start_background_services(bot)
 
     print("Bot started...")
     bot.infinity_polling()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
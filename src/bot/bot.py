@@ -1,11 +1,50 @@
+import threading
+
 from telebot import TeleBot
-from config.settings import BOT_TOKEN
+from config.settings import BOT_TOKEN, BOT_NUM_THREADS, BACKGROUND_SERVICES_DELAY
 from .handlers import base_handlers
+from .middlewares.throttling import ThrottlingMiddleware
 
 def create_bot():
-    bot = TeleBot(BOT_TOKEN)
+    bot = TeleBot(BOT_TOKEN, num_threads=BOT_NUM_THREADS, use_class_middlewares=True)
+
+    # Register middlewares
+    bot.setup_middleware(ThrottlingMiddleware(bot))
 
     # Register handlers
     base_handlers.register_base_handlers(bot)
 
-    return bot
\ No newline at end of file
+    return bot
+
+
+def start_background_services(bot, delay=BACKGROUND_SERVICES_DELAY):
+    """
+    Start the channel worker and token sync `delay` seconds from now, keeping their
+    imports (DexHunter service, msgspec, sqlite) off the path to the first reply.
+    With delay <= 0 they start right away. Returns a function that stops them.
+    """
+    services = []
+
+    def start():
+        from src.bot.services.token_sync_service import TokenSyncService
+        from src.bot.services.worker_service import WorkerService
+
+        services.extend([WorkerService(bot), TokenSyncService()])
+        for service in services:
+            service.start()
+
+    timer = None
+    if delay > 0:
+        timer = threading.Timer(delay, start)
+        timer.daemon = True
+        timer.start()
+    else:
+        start()
+
+    def stop():
+        if timer is not None:
+            timer.cancel()
+        for service in services:
+            service.stop()
+
+    return stop
@@ -1,13 +1,31 @@
-import koios_api
 from telebot import TeleBot, types
-from src.bot.services.dex_service import DexHunterService
-from src.bot.services.cardano_service import CardanoService
-from src.bot.services.worker_service import WorkerService
+from config.settings import LADDER_AMOUNTS, INLINE_RESULTS_LIMIT
 from src.bot.utils.formatters import FormatUtils
+from src.bot.utils.lazy_import import lazy_import
 from src.bot.utils.mapping_token_name import FormatTokenName
 
+# Services (and msgspec, sqlite, matplotlib pools behind them) load on the first command that uses them
+dex_service = lazy_import("src.bot.services.dex_service")
+quote_engine = lazy_import("src.bot.services.quote_engine")
+cardano_service = lazy_import("src.bot.services.cardano_service")
+chart_service = lazy_import("src.bot.services.chart_service")
+epoch_history_service = lazy_import("src.bot.services.epoch_history_service")
+worker_service = lazy_import("src.bot.services.worker_service")
+
 
 def register_base_handlers(bot: TeleBot):
+    def resolve_tokens(message, symbols):
+        """Resolve tickers like SNEK to token ids, replying and returning None if one is unknown"""
+        token_index = FormatTokenName.load_token_index()
+        token_ids = []
+        for symbol in symbols:
+            token_id = token_index.resolve(symbol)
+            if token_id is None:
+                bot.reply_to(message, f"❌ Unknown token: {symbol}. Search for it by typing the bot's @username and a ticker in any chat.")
+                return None
+            token_ids.append(token_id)
+        return token_ids
+
     @bot.message_handler(commands=['start'])
     def send_welcome(message):
           # Create custom keyboard markup
@@ -33,8 +51,7 @@ def register_base_handlers(bot: TeleBot):
 
         bot.reply_to(message, "Fetching trending pairs... 🔍")
 
-        dex_service = DexHunterService()
-        result = dex_service.get_trending(period)
+        result = dex_service.DexHunterService.get_trending(period)
         tokens_mapping = FormatTokenName.load_token_name()
 
         if isinstance(result, str):
@@ -45,12 +62,12 @@ def register_base_handlers(bot: TeleBot):
         pairs = result[:10] if len(result) > 10 else result
 
         for idx, pair in enumerate(pairs, 1):
-            token_id = pair['token_id']
+            token_id = pair.token_id
             token_name = tokens_mapping.get(token_id, "Unknown Token")
-            current_volume = pair['current_period_volume']
-            volume_change = pair['volume_change_percentage']
-            price_change = pair['price_change_percentage']
-            current_price = pair['current_period_closing_price']
+            current_volume = pair.current_period_volume
+            volume_change = pair.volume_change_percentage
+            price_change = pair.price_change_percentage
+            current_price = pair.current_period_closing_price
 
             volume_formatted = f"{current_volume:,.2f}"
             price_formatted = f"{current_price:.8f}" if current_price < 0.01 else f"{current_price:.4f}"
@@ -64,7 +81,7 @@ def register_base_handlers(bot: TeleBot):
             response_text += f"├ {price_emoji} Price Change: {price_change:+,.2f}%\n"
             response_text += f"├ 💎 Volume: ${volume_formatted}\n"
             response_text += f"├ {volume_emoji} Vol Change: {volume_change:+,.2f}%\n"
-            response_text += f"└ 🔄 Trades: {pair['amount_buys']}↗️ | {pair['amount_sales']}↘️\n\n"
+            response_text += f"└ 🔄 Trades: {pair.amount_buys}↗️ | {pair.amount_sales}↘️\n\n"
 
         if not pairs:
             response_text += "❌ No trending pairs found for this period.\n"
@@ -85,36 +102,52 @@ def register_base_handlers(bot: TeleBot):
         else:
             bot.reply_to(message, response_text, parse_mode='HTML')
 
+        if pairs:
+            chart_service.ChartService.send_trending_chart(bot, message.chat.id, period, pairs, tokens_mapping)
+
     @bot.message_handler(commands=['estimate'])
     def get_estimate(message):
-        global amount, token_in, token_out
         try:
-            dex_service = DexHunterService()
             parts = message.text.split()
             if len(parts) == 3:
                 __, amount, token = parts
-                try:
-                    result_in = dex_service.get_swap_estimate(amount, token_in=token, token_out="", slippage=5)
-                    if not result_in or isinstance(result_in, str):
-                        result_out = dex_service.get_swap_estimate(amount, token_in="", token_out=token, slippage=5)
-                        if isinstance(result_out, str) or not result_out:
-                            bot.reply_to(message, f"❌ Error calculating swap estimate: {result_in}")
-                            return
-                        token_in = ""
-                        token_out = token
-                    else:
-                        token_in = token
-                        token_out = ""
-                except Exception as e:
-                    bot.reply_to(message, f"❌ Error fetching estimated swap estimate: {e}")
+                resolved = resolve_tokens(message, [token])
+                if resolved is None:
+                    return
+                token = resolved[0]
+                if not token:
+                    bot.reply_to(message, "❌ ADA is always one side of the swap, give the other token: /estimate <amount> <token>")
                     return
 
-            bot.reply_to(message, "🔄 Calculating swap estimate...")
-            result = dex_service.get_swap_estimate(amount, token_in, token_out)
-            if isinstance(result, str):
-                bot.reply_to(message, f"❌ Error getting estimate: {result}")
+                bot.reply_to(message, "🔄 Calculating swap estimate...")
+
+                # Selling the token is quoted first, buying it only if no DEX routes the sale
+                token_in, token_out, quotes = dex_service.DexHunterService.compare_swap_directions(amount, token)
+            elif len(parts) == 4:
+                __, amount, token_in, token_out = parts
+                resolved = resolve_tokens(message, [token_in, token_out])
+                if resolved is None:
+                    return
+                token_in, token_out = resolved
+                if token_in == token_out:
+                    bot.reply_to(message, "❌ token_in and token_out must be different tokens")
+                    return
+
+                bot.reply_to(message, "🔄 Calculating swap estimate...")
+
+                # Quote every DEX filter at once, the reply waits only for the slowest one
+                quotes = dex_service.DexHunterService.compare_swap_estimates(amount, token_in, token_out)
+            else:
+                bot.reply_to(message, "❌ Invalid format. Use: /estimate <amount> <token> or /estimate <amount> <token_in> <token_out>")
+                return
+
+            valid_quotes = [(label, quote) for label, quote in quotes if not isinstance(quote, str)]
+            if not valid_quotes:
+                bot.reply_to(message, f"❌ Error getting estimate: {quotes[0][1]}")
                 return
 
+            best_label, result = max(valid_quotes, key=lambda item: item[1].total_output)
+
             # Format response with beautiful styling
             response_text = (
                 "━━━━━━━━━━━━━━━━━━━━━\n"
@@ -125,36 +158,48 @@ def register_base_handlers(bot: TeleBot):
             # Token Information
             response_text += (
                 "🔄 <b>Swap Information</b>\n"
+                f"• Best Quote: {best_label}\n"
                 f"• Input Amount: {amount}\n"
-                f"• Output Amount: {result.get('total_output', 'N/A')}\n"
-                f"• Rate: 1 Token = {result.get('net_price', 'N/A')} / {result.get('net_price_reverse', 'N/A')}\n\n"
+                f"• Output Amount: {result.total_output}\n"
+                f"• Rate: 1 Token = {result.net_price or 'N/A'} / {result.net_price_reverse or 'N/A'}\n\n"
             )
 
             # Fee Information
             response_text += (
                 "💰 <b>Fee Details</b>\n"
-                f"• Total Fee: {result.get('total_fee', 0)}\n"
-                f"• Batcher Fee: {result.get('batcher_fee', 0)}\n"
-                f"• Partner Fee: {result.get('partner_fee', 0)}\n\n"
+                f"• Total Fee: {result.total_fee}\n"
+                f"• Batcher Fee: {result.batcher_fee}\n"
+                f"• Partner Fee: {result.partner_fee}\n\n"
             )
 
             # Route Details
-            splits = result.get('splits', [])
+            splits = result.splits
             if splits:
-                split = splits[0]
+                response_text += "🛣 <b>Route Information</b>\n"
+                for split in splits:
+                    response_text += (
+                        f"• DEX: {split.dex}"
+                        f" | Impact: {split.price_impact * 100:.4f}%"
+                        f" | Fee: {split.pool_fee * 100:.2f}%\n"
+                    )
+                response_text += "\n"
+
+                # Output Details
                 response_text += (
-                    "🛣 <b>Route Information</b>\n"
-                    f"• DEX: {split.get('dex', 'N/A')}\n"
-                    f"• Price Impact: {split.get('price_impact', 'N/A') * 100:.4f}%\n"
-                    f"• Pool Fee: {split.get('pool_fee', 'N/A') * 100:.2f}%\n\n"
+                    "📊 <b>Output Details</b>\n"
+                    f"• With Slippage: {sum(split.expected_output for split in splits)}\n"
+                    f"• Without Slippage: {sum(split.expected_output_without_slippage for split in splits)}\n\n"
                 )
 
-            # Output Details
-            response_text += (
-                "📊 <b>Output Details</b>\n"
-                f"• With Slippage: {split.get('expected_output', 'N/A')}\n"
-                f"• Without Slippage: {split.get('expected_output_without_slippage', 'N/A')}\n\n"
-            )
+            # DEX Comparison
+            response_text += "⚖️ <b>DEX Comparison</b>\n<pre>"
+            for label, quote in quotes:
+                if not isinstance(quote, str):
+                    marker = "★" if label == best_label else " "
+                    response_text += f"{marker} {label:<11} {FormatUtils.format_number(quote.total_output, 4):>18}\n"
+                else:
+                    response_text += f"  {label:<11} {'no route':>18}\n"
+            response_text += "</pre>\n\n"
 
             # Add promotional footer
             response_text += (
@@ -175,22 +220,107 @@ def register_base_handlers(bot: TeleBot):
             )
             bot.reply_to(message, error_message, parse_mode='HTML')
 
+    @bot.message_handler(commands=['ladder'])
+    def get_ladder(message):
+        try:
+            parts = message.text.split()
+            if len(parts) != 2:
+                bot.reply_to(message, "❌ Invalid format. Use: /ladder <token_id or ticker>")
+                return
+
+            _, token = parts
+            resolved = resolve_tokens(message, [token])
+            if resolved is None:
+                return
+            token = resolved[0]
+            if not token:
+                bot.reply_to(message, "❌ The ladder quotes buying a token with ADA, give the token: /ladder <token_id or ticker>")
+                return
+
+            bot.reply_to(message, "🔄 Calculating price impact ladder...")
+
+            pools = quote_engine.QuoteEngine.get_pools(token)
+            if isinstance(pools, str):
+                bot.reply_to(message, f"❌ Error getting pool data: {pools}")
+                return
+
+            ladder = quote_engine.QuoteEngine.quote_ladder(pools, LADDER_AMOUNTS)
+
+            response_text = (
+                "━━━━━━━━━━━━━━━━━━━━━\n"
+                "🪜 <b>PRICE IMPACT LADDER</b>\n"
+                "━━━━━━━━━━━━━━━━━━━━━\n\n"
+                f"Buying <code>{token}</code> with ADA\n\n"
+                "<pre>"
+                f"{'ADA in':>9} {'Tokens out':>16} {'Impact':>8}  DEX\n"
+            )
+            for rung in ladder:
+                response_text += (
+                    f"{rung['amount_in']:>9,} {FormatUtils.format_number(rung['amount_out']):>16} "
+                    f"{rung['price_impact'] * 100:>7.2f}%  {rung['dex']}\n"
+                )
+            response_text += "</pre>\n"
+
+            response_text += (
+                "<i>Constant-product estimate from cached pool reserves, use /estimate for an exact quote.</i>\n\n"
+                "━━━━━━━━━━━━━━━━━━━━━\n"
+                "🔥 <b>Want Fear and Greed updates?</b>\n"
+                "📢 Join @cardano_hunter now!\n"
+                "━━━━━━━━━━━━━━━━━━━━━"
+            )
+
+            bot.reply_to(message, response_text, parse_mode='HTML')
+
+        except Exception as e:
+            error_message = (
+                "❌ <b>Error occurred</b>\n\n"
+                f"{str(e)}\n\n"
+                "Please try again or contact support if the issue persists."
+            )
+            bot.reply_to(message, error_message, parse_mode='HTML')
+
     @bot.message_handler(commands=['feargreed'])
     def handle_fear_greed(message):
         """Handle manual fear and greed index requests"""
 
         bot.reply_to(message, "Fetching Fear & Greed Index... 🔍")
 
-        dex_service = DexHunterService()
-        result = dex_service.get_fear_greed()
+        result = dex_service.DexHunterService.get_fear_greed()
 
         if isinstance(result, str) and result.startswith("Error"):
             bot.reply_to(message, f"Error fetching Fear & Greed Index: {result}")
             return
+        if not result:
+            bot.reply_to(message, "Error fetching Fear & Greed Index: No data available")
+            return
 
-        worker = WorkerService(bot)
-        formatted_message = worker._format_fear_greed_message(result)
+        worker = worker_service.WorkerService(bot)
+        formatted_message = worker._format_fear_greed_message(result[0])
         bot.reply_to(message, formatted_message, parse_mode='HTML')
+        chart_service.ChartService.send_fear_greed_chart(bot, message.chat.id)
+
+
+    @bot.inline_handler(func=lambda query: True)
+    def search_tokens(inline_query):
+        """Answer @bot <ticker> searches from the local token index, no upstream calls"""
+        token_index = FormatTokenName.load_token_index()
+        results = []
+        for row in token_index.search(inline_query.query, limit=INLINE_RESULTS_LIMIT):
+            token = token_index.record(row)
+            verified = " ✅" if token['is_verified'] else ""
+            ticker = token['ticker'] or token['token_ascii']
+            results.append(types.InlineQueryResultArticle(
+                id=str(row),
+                title=f"{ticker}{verified}",
+                description=token['token_id'],
+                input_message_content=types.InputTextMessageContent(
+                    f"💎 <b>{ticker}</b>{verified}\n"
+                    f"Token ID: <code>{token['token_id']}</code>\n\n"
+                    f"Use: <code>/estimate 100 {ticker}</code>",
+                    parse_mode='HTML'
+                )
+            ))
+        bot.answer_inline_query(inline_query.id, results, cache_time=300)
 
 
     # Cardano Handler
@@ -201,8 +331,7 @@ def register_base_handlers(bot: TeleBot):
             # Send initial loading message
             bot.reply_to(message, "🔍 Fetching latest block information...")
 
-            cardano_service = CardanoService()
-            result = cardano_service.get_cardano_tip()
+            result = cardano_service.CardanoService.get_cardano_tip()
 
             if isinstance(result, str):
                 error_message = (
@@ -220,12 +349,12 @@ def register_base_handlers(bot: TeleBot):
                 "━━━━━━━━━━━━━━━━━━━━━\n\n"
 
                 "📦 <b>Block Details</b>\n"
-                f"• Block Number: <code>{result['block_no']}</code>\n"
-                f"• Epoch: <code>{result['epoch_no']}</code>\n"
-                f"• Slot: <code>{result['abs_slot']}</code>\n\n"
+                f"• Block Number: <code>{result.block_no}</code>\n"
+                f"• Epoch: <code>{result.epoch_no}</code>\n"
+                f"• Slot: <code>{result.abs_slot}</code>\n\n"
 
                 "🔗 <b>Block Hash</b>\n"
-                f"<code>{result['hash']}</code>\n\n"
+                f"<code>{result.hash}</code>\n\n"
 
                 "━━━━━━━━━━━━━━━━━━━━━\n"
                 "🔍 <i>Powered by Cardano Hunter</i>\n"
@@ -276,8 +405,7 @@ def register_base_handlers(bot: TeleBot):
 
             bot.reply_to(message, f"Fetching ADA price and asset information for {len(asset_list)} assets... 💰")
 
-            cardano_service = CardanoService()
-            result = cardano_service.get_ada_price(asset_list)
+            result = cardano_service.CardanoService.get_ada_price(asset_list)
 
             if isinstance(result, str):
                 bot.reply_to(message, f"Error: {result}")
@@ -285,23 +413,23 @@ def register_base_handlers(bot: TeleBot):
 
             response_text = "💎 Cardano (ADA) Information:\n\n"
 
-            if "price_data" in result:
+            if result["price_data"]:
                 price_data = result["price_data"]
-                response_text += f"💰 Price: ${price_data.get('usd', 'N/A')}\n"
-                response_text += f"📊 24h Volume: ${price_data.get('usd_24h_vol', 'N/A'):,.2f}\n"
-                response_text += f"💹 Market Cap: ${price_data.get('usd_market_cap', 'N/A'):,.2f}\n\n"
+                response_text += f"💰 Price: ${price_data.usd or 'N/A'}\n"
+                response_text += f"📊 24h Volume: ${price_data.usd_24h_vol:,.2f}\n"
+                response_text += f"💹 Market Cap: ${price_data.usd_market_cap:,.2f}\n\n"
 
-            if "asset_info" in result and result["asset_info"]:
+            if result["asset_info"]:
                 response_text += "🏦 Asset Information:\n"
                 for asset in result["asset_info"]:
-                    response_text += f"\nPolicy ID: {asset.get('policy_id', 'N/A')}\n"
-                    response_text += f"Asset Name: {asset.get('asset_name_ascii', 'N/A')}\n"
-                    response_text += f"Fingerprint: {asset.get('fingerprint', 'N/A')}\n"
-                    response_text += f"Total Supply: {asset.get('total_supply', 'N/A')}\n"
+                    response_text += f"\nPolicy ID: {asset.policy_id}\n"
+                    response_text += f"Asset Name: {asset.asset_name_ascii}\n"
+                    response_text += f"Fingerprint: {asset.fingerprint}\n"
+                    response_text += f"Total Supply: {asset.total_supply}\n"
 
-                    if 'metadata' in asset:
+                    if asset.metadata:
                         response_text += "Metadata:\n"
-                        metadata = asset['metadata']
+                        metadata = asset.metadata
                         if 'name' in metadata:
                             response_text += f"- Name: {metadata['name']}\n"
                         if 'description' in metadata:
@@ -330,41 +458,40 @@ def register_base_handlers(bot: TeleBot):
 
             bot.reply_to(message, "Fetching address information... 🔍")
 
-            cardano_service = CardanoService()
-            result = cardano_service.get_address_info(address)
+            result = cardano_service.CardanoService.get_address_info(address)
 
             if isinstance(result, str):
                 bot.reply_to(message, f"Error: {result}")
                 return
 
             response_text = "📍 *Address Information*\n\n"
-            response_text += f"💰 *Balance:* `{FormatUtils.format_ada(result['balance'])} ADA`\n"
-            stake_address = result['stake_address'] if result['stake_address'] else 'Not delegated'
+            response_text += f"💰 *Balance:* `{FormatUtils.format_ada(result.balance)} ADA`\n"
+            stake_address = result.stake_address if result.stake_address else 'Not delegated'
             response_text += f"🎯 *Stake Address:* `{stake_address}`\n"
-            response_text += f"📜 *Script Address:* `{'Yes' if result['script_address'] else 'No'}`\n"
+            response_text += f"📜 *Script Address:* `{'Yes' if result.script_address else 'No'}`\n"
 
             # UTXO Information
-            if 'utxo_set' in result and result['utxo_set']:
+            if result.utxo_set:
                 response_text += "\n💎 *UTXO Information:*\n"
-                for utxo in result['utxo_set'][:3]:  # Show first 3 UTXOs
+                for utxo in result.utxo_set[:3]:  # Show first 3 UTXOs
                     response_text += f"\n▪️ *UTXO:*\n"
-                    response_text += f"  TX Hash: `{utxo['tx_hash']}`\n"
-                    response_text += f"  Value: `{FormatUtils.format_ada(utxo['value'])} ADA`\n"
+                    response_text += f"  TX Hash: `{utxo.tx_hash}`\n"
+                    response_text += f"  Value: `{FormatUtils.format_ada(utxo.value)} ADA`\n"
 
-                    if 'asset_list' in utxo and utxo['asset_list']:
+                    if utxo.asset_list:
                         response_text += "  *Assets:*\n"
-                        for asset in utxo['asset_list']:
+                        for asset in utxo.asset_list:
                             try:
                                 # Try to decode asset name from hex
-                                asset_name = bytes.fromhex(asset['asset_name']).decode('utf-8')
+                                asset_name = bytes.fromhex(asset.asset_name).decode('utf-8')
                             except:
-                                asset_name = asset['asset_name']
+                                asset_name = asset.asset_name
 
-                            response_text += f"    • {asset_name}: `{asset['quantity']}`\n"
-                            response_text += f"      Policy: `{asset['policy_id']}`\n"
+                            response_text += f"    • {asset_name}: `{asset.quantity}`\n"
+                            response_text += f"      Policy: `{asset.policy_id}`\n"
 
-                if len(result['utxo_set']) > 3:
-                    response_text += f"\n_...and {len(result['utxo_set']) - 3} more UTXOs_"
+                if len(result.utxo_set) > 3:
+                    response_text += f"\n_...and {len(result.utxo_set) - 3} more UTXOs_"
 
             bot.reply_to(message, response_text, parse_mode='Markdown')
 
@@ -379,43 +506,102 @@ def register_base_handlers(bot: TeleBot):
         if len(command_parts) > 1:
             epoch_no = int(command_parts[1])
         else:
-            tip_info = CardanoService.get_cardano_tip()
-            if not tip_info or not isinstance(tip_info, dict):
+            tip_info = cardano_service.CardanoService.get_cardano_tip()
+            if not tip_info or isinstance(tip_info, str):
                 bot.reply_to(message, "Error: Could not fetch current epoch")
                 return
 
-            epoch_no = tip_info['epoch_no']
+            epoch_no = tip_info.epoch_no
 
         bot.reply_to(message, "Fetching epoch information... ⏳")
-        cardano_service = CardanoService()
-        result = cardano_service.get_epoch_info(epoch_no)
+        result = cardano_service.CardanoService.get_epoch_info(epoch_no)
 
         if isinstance(result, str):
             bot.reply_to(message, f"Error: {result}")
             return
 
         response_text = "📊 Epoch Information\n\n"
-        response_text += f"🔢 Epoch Number: {result['epoch_no']}\n\n"
+        response_text += f"🔢 Epoch Number: {result.epoch_no}\n\n"
 
         # Time Information
         response_text += "⏰ Time Details\n"
-        response_text += f"▪️ Start: {FormatUtils.format_timestamp(result['start_time'])}\n"
-        response_text += f"▪️ End: {FormatUtils.format_timestamp(result['end_time'])}\n"
-        response_text += f"▪️ First Block: {FormatUtils.format_timestamp(result['first_block_time'])}\n"
-        response_text += f"▪️ Last Block: {FormatUtils.format_timestamp(result['last_block_time'])}\n\n"
+        response_text += f"▪️ Start: {FormatUtils.format_timestamp(result.start_time)}\n"
+        response_text += f"▪️ End: {FormatUtils.format_timestamp(result.end_time)}\n"
+        response_text += f"▪️ First Block: {FormatUtils.format_timestamp(result.first_block_time)}\n"
+        response_text += f"▪️ Last Block: {FormatUtils.format_timestamp(result.last_block_time)}\n\n"
 
         # Stake and Rewards
         response_text += "💰 Stake & Rewards\n"
-        response_text += f"▪️ Active Stake: {FormatUtils.format_ada(result['active_stake'])} ADA\n"
-        response_text += f"▪️ Total Rewards: {FormatUtils.format_ada(result['total_rewards'])} ADA\n"
-        response_text += f"▪️ Avg Block Reward: {FormatUtils.format_ada(result['avg_blk_reward'])} ADA\n\n"
+        response_text += f"▪️ Active Stake: {FormatUtils.format_ada(result.active_stake)} ADA\n"
+        response_text += f"▪️ Total Rewards: {FormatUtils.format_ada(result.total_rewards)} ADA\n"
+        response_text += f"▪️ Avg Block Reward: {FormatUtils.format_ada(result.avg_blk_reward)} ADA\n\n"
 
         # Block and Transaction Information
         response_text += "📦 Blocks & Transactions\n"
-        response_text += f"▪️ Block Count: {result['blk_count']:,}\n"
-        response_text += f"▪️ Transaction Count: {result['tx_count']:,}\n"
-        response_text += f"▪️ Total Fees: {FormatUtils.format_ada(result['fees'])} ADA\n"
-        response_text += f"▪️ Total Output: {FormatUtils.format_ada(result['out_sum'])} ADA\n"
+        response_text += f"▪️ Block Count: {result.blk_count:,}\n"
+        response_text += f"▪️ Transaction Count: {result.tx_count:,}\n"
+        response_text += f"▪️ Total Fees: {FormatUtils.format_ada(result.fees)} ADA\n"
+        response_text += f"▪️ Total Output: {FormatUtils.format_ada(result.out_sum)} ADA\n"
+
+        bot.reply_to(message, response_text)
+
+    @bot.message_handler(commands=['epoch_range'])
+    def get_epoch_range(message):
+        command_parts = message.text.split()
+        try:
+            start, end = sorted((int(command_parts[1]), int(command_parts[2])))
+        except (IndexError, ValueError):
+            bot.reply_to(message, "Usage: /epoch_range <from_epoch> <to_epoch>\nExample: /epoch_range 400 500")
+            return
+
+        history = epoch_history_service.EpochHistoryService.get_history()
+        if isinstance(history, str):
+            bot.reply_to(message, f"Error: {history}")
+            return
+
+        stats = history.range_stats(start, end)
+        if stats is None:
+            available = f" (available: {history.epochs[0]}-{history.latest_epoch})" if len(history) else ""
+            bot.reply_to(message, f"Error: No epoch data between {start} and {end}{available}")
+            return
+
+        def ada(lovelace):
+            return f"{FormatUtils.format_ada(lovelace)} ADA"
+
+        def count(value):
+            return f"{value:,.0f}"
+
+        # (field, title, formatter, whether a range total is meaningful)
+        sections = (
+            ("tx_count", "🔄 Transactions", count, True),
+            ("blk_count", "📦 Blocks", count, True),
+            ("fees", "💸 Fees", ada, True),
+            ("out_sum", "💰 Total Output", ada, True),
+            ("active_stake", "🔒 Active Stake", ada, False),
+            ("total_rewards", "🎁 Rewards", ada, True),
+        )
+
+        response_text = "📈 Epoch Range Analytics\n\n"
+        response_text += f"🔢 Epochs {stats['from']} → {stats['to']} ({stats['count']} epochs)\n\n"
+
+        for field, title, fmt, summable in sections:
+            metric = stats["metrics"][field]
+            if metric is None:
+                continue
+
+            change = f" ({metric['change']:+.2f}%)" if metric["change"] is not None else ""
+            response_text += f"{title}\n"
+            if summable:
+                response_text += f"▪️ Total: {fmt(metric['total'])}\n"
+            response_text += f"▪️ Avg/Epoch: {fmt(metric['average'])}\n"
+            response_text += f"▪️ Trend: {fmt(metric['first'])} → {fmt(metric['last'])}{change}\n"
+            response_text += f"▪️ Peak: {fmt(metric['peak'][0])} (epoch {metric['peak'][1]})\n"
+            if metric["jump"] and metric["jump"][0] > 0:
+                response_text += f"▪️ Biggest Jump: +{fmt(metric['jump'][0])} (epoch {metric['jump'][1]})\n"
+            response_text += "\n"
+
+        if stats["to"] == history.latest_epoch:
+            response_text += f"⚠️ Epoch {stats['to']} is still in progress, its figures are partial.\n"
 
         bot.reply_to(message, response_text)
 
@@ -428,7 +614,8 @@ def register_base_handlers(bot: TeleBot):
         elif call.data == "estimate_info":
             bot.answer_callback_query(call.id)
             bot.send_message(call.message.chat.id,
-                             "Use /estimate <amount> <token_in> <token_out> to get swap estimate.")
+                             "Use /estimate <amount> <token_in> <token_out> to get swap estimate.\n"
+                             "Use /ladder <token_id> to compare price impact across trade sizes.")
         elif call.data == "fear_greed":
             bot.answer_callback_query(call.id)
             bot.send_message(call.message.chat.id, "Use /feargreed to get the current Fear & Greed Index.")
@@ -440,7 +627,9 @@ def register_base_handlers(bot: TeleBot):
             bot.send_message(call.message.chat.id, "Use /adaprice to get current ADA price.")
         elif call.data == "epoch_info":
             bot.answer_callback_query(call.id)
-            bot.send_message(call.message.chat.id, "Use /epoch to get current epoch information.")
+            bot.send_message(call.message.chat.id,
+                             "Use /epoch to get current epoch information.\n"
+                             "Use /epoch_range <from> <to> to see trends across many epochs.")
         elif call.data == "address_info":
             bot.answer_callback_query(call.id)
             bot.send_message(call.message.chat.id, "Use /address <address> to get address information.")
@@ -0,0 +1,82 @@
+import logging
+import time
+
+from telebot.handler_backends import BaseMiddleware, CancelUpdate
+
+from config.settings import (
+    THROTTLE_USER_RATE, THROTTLE_USER_BURST,
+    THROTTLE_CHAT_RATE, THROTTLE_CHAT_BURST,
+    DUPLICATE_COMMAND_WINDOW, DUPLICATE_COMMAND_MAX_IN_FLIGHT
+)
+from src.bot.utils.rate_limiter import RateLimiter, CommandCollapser
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """Per-user/per-chat token bucket throttling and duplicate command collapsing"""
+
+    def __init__(self, bot):
+        super().__init__()
+        self.bot = bot
+        self.update_sensitive = True
+        self.update_types = ['message', 'callback_query']
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.user_limiter = RateLimiter(THROTTLE_USER_RATE, THROTTLE_USER_BURST)
+        self.chat_limiter = RateLimiter(THROTTLE_CHAT_RATE, THROTTLE_CHAT_BURST)
+        self.collapser = CommandCollapser(DUPLICATE_COMMAND_WINDOW, DUPLICATE_COMMAND_MAX_IN_FLIGHT)
+        self._warned = {}  # user_id -> when they were last told to slow down
+        self._warned_max_keys = 10_000
+
+    def pre_process_message(self, message, data):
+        user_id = message.from_user.id if message.from_user else None
+        chat_id = message.chat.id
+
+        if not self._allow(user_id, chat_id):
+            if user_id not in self._warned:
+                self._warn(user_id)
+                self.bot.reply_to(message, "⏳ Too many requests, please slow down.")
+            return CancelUpdate()
+        self._warned.pop(user_id, None)
+
+        text = message.text or ""
+        if text.startswith('/'):
+            key = (chat_id, " ".join(text.split()))
+            if not self.collapser.claim(key):
+                self.logger.debug(f"Collapsed duplicate command in chat {chat_id}: {text}")
+                return CancelUpdate()
+            data['collapse_key'] = key
+
+    def post_process_message(self, message, data, exception):
+        if 'collapse_key' in data:
+            self.collapser.release(data['collapse_key'])
+
+    def pre_process_callback_query(self, call, data):
+        chat_id = call.message.chat.id if call.message else call.from_user.id
+
+        if not self._allow(call.from_user.id, chat_id):
+            self.bot.answer_callback_query(call.id, "⏳ Too many requests, please slow down.")
+            return CancelUpdate()
+
+        key = (chat_id, call.data)
+        if not self.collapser.claim(key):
+            self.bot.answer_callback_query(call.id)
+            return CancelUpdate()
+        data['collapse_key'] = key
+
+    def post_process_callback_query(self, call, data, exception):
+        if 'collapse_key' in data:
+            self.collapser.release(data['collapse_key'])
+
+    def _warn(self, user_id):
+        now = time.monotonic()
+        if len(self._warned) >= self._warned_max_keys:
+            # By the time a user's bucket has refilled they are no longer throttled, drop the mark
+            refill = THROTTLE_USER_BURST / THROTTLE_USER_RATE if THROTTLE_USER_RATE > 0 else 0
+            for key in [key for key, warned_at in self._warned.items() if now - warned_at >= refill]:
+                del self._warned[key]
+        self._warned[user_id] = now
+
+    def _allow(self, user_id, chat_id):
+        if user_id is not None and not self.user_limiter.allow(user_id):
+            return False
+        return self.chat_limiter.allow(chat_id)
@@ -0,0 +1,56 @@
+import msgspec
+
+# Generic JSON decoding (bytes or str) for payloads that are cached before being typed
+loads = msgspec.json.decode
+
+# Compact JSON encoding of plain values and models, e.g. for the shared cache
+dumps = msgspec.json.encode
+
+# Raised by `loads` on a body that is not JSON (e.g. an HTML error page)
+JSONDecodeError = msgspec.DecodeError
+
+_decoders = {}
+
+
+class DecodeError(ValueError):
+    """An upstream payload is missing a field we read or has the wrong type"""
+
+
+class Model(msgspec.Struct, gc=False):
+    """
+    Compact, read-only response model
+
+    Subclasses declare only the payload fields we read; every other field is
+    skipped by the decoder without being materialized. Declared fields are type
+    checked, with lax conversion for numbers sent as strings (Koios lovelace).
+    Models are untracked by the cyclic GC, which keeps large lists cheap.
+    """
+
+
+def decode_json(model_type, body):
+    """
+    Decode a raw response body straight into `model_type` (e.g. list[TrendingPair])
+
+    Raises:
+        DecodeError: if the payload does not match the fields we read
+    """
+    decoder = _decoders.get(model_type)
+    if decoder is None:
+        decoder = _decoders[model_type] = msgspec.json.Decoder(model_type, strict=False)
+    try:
+        return decoder.decode(body)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise DecodeError(str(e)) from None
+
+
+def decode_payload(model_type, payload):
+    """
+    Convert an already parsed (e.g. cached) payload into `model_type`, passing
+    service error strings through and turning validation failures into one.
+    """
+    if isinstance(payload, str):
+        return payload
+    try:
+        return msgspec.convert(payload, model_type, strict=False)
+    except msgspec.ValidationError as e:
+        return f"Error: {str(e)}"
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from src.bot.models.base import Model
+
+
+class CoinPrice(Model):
+    """One coin of /simple/price with 24h volume and market cap"""
+    usd: Optional[float] = None
+    usd_24h_vol: float = 0.0
+    usd_market_cap: float = 0.0
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from src.bot.models.base import Model
+
+
+class TrendingPair(Model):
+    """One entry of /swap/trending"""
+    token_id: str
+    current_period_volume: float = 0.0
+    volume_change_percentage: float = 0.0
+    price_change_percentage: float = 0.0
+    current_period_closing_price: float = 0.0
+    amount_buys: int = 0
+    amount_sales: int = 0
+
+
+class SwapSplit(Model):
+    """One pool leg of a /swap/estimate route"""
+    dex: str = "N/A"
+    pool_id: Optional[str] = None
+    amount_in: Optional[float] = None
+    expected_output: float = 0.0
+    expected_output_without_slippage: float = 0.0
+    price_impact: float = 0.0
+    pool_fee: float = 0.0
+
+
+class SwapEstimate(Model):
+    """/swap/estimate response, an error payload (no route) fails to decode"""
+    total_output: float
+    splits: list[SwapSplit]
+    net_price: Optional[float] = None
+    net_price_reverse: Optional[float] = None
+    total_fee: float = 0.0
+    batcher_fee: float = 0.0
+    partner_fee: float = 0.0
+
+
+class FearGreed(Model):
+    """One period of /stats/fear_and_greed"""
+    global_buy_volume: float
+    global_sell_volume: float
+    global_buy_count: int = 0
+    global_sell_count: int = 0
+    count: int = 0
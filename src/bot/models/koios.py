@@ -0,0 +1,61 @@
+from typing import Optional
+
+from src.bot.models.base import Model
+
+
+class ChainTip(Model):
+    """/tip"""
+    block_no: int
+    epoch_no: int
+    abs_slot: Optional[int] = None
+    hash: Optional[str] = None
+
+
+class EpochInfo(Model):
+    """/epoch_info, lovelace amounts arrive as strings and are decoded to int"""
+    epoch_no: int
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
+    first_block_time: Optional[int] = None
+    last_block_time: Optional[int] = None
+    # Null until the epoch's stake snapshot / rewards are calculated
+    active_stake: Optional[int] = None
+    total_rewards: Optional[int] = None
+    avg_blk_reward: Optional[int] = None
+    blk_count: int = 0
+    tx_count: int = 0
+    fees: int = 0
+    out_sum: int = 0
+
+
+class AssetInfo(Model):
+    """/asset_info"""
+    policy_id: str
+    asset_name: Optional[str] = ""
+    asset_name_ascii: Optional[str] = "N/A"
+    fingerprint: Optional[str] = "N/A"
+    total_supply: Optional[str] = "N/A"
+    metadata: Optional[dict] = None
+
+
+class UtxoAsset(Model):
+    """Native asset held in a UTXO"""
+    policy_id: str
+    asset_name: Optional[str] = ""
+    quantity: str = "0"
+
+
+class Utxo(Model):
+    """Entry of an address' utxo_set"""
+    tx_hash: str
+    value: int = 0
+    asset_list: list[UtxoAsset] = []
+
+
+class AddressInfo(Model):
+    """/address_info"""
+    address: str
+    balance: int = 0
+    stake_address: Optional[str] = None
+    script_address: bool = False
+    utxo_set: list[Utxo] = []
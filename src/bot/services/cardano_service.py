@@ -1,6 +1,69 @@
 import requests
-import koios_api
-from config.settings import KOIOS_API_URL, KOIOS_HEADERS, COINGECKO_API_URL
+from config.settings import (
+    KOIOS_API_URL, KOIOS_HEADERS, COINGECKO_API_URL, UPSTREAM_TIMEOUT, EPOCH_HISTORY_PAGE_SIZE
+)
+from src.bot.models.base import decode_json, decode_payload
+from src.bot.models.coingecko import CoinPrice
+from src.bot.models.koios import ChainTip, EpochInfo, AssetInfo, AddressInfo
+from src.bot.utils.lazy_import import lazy_import
+from src.bot.utils.micro_batcher import MicroBatcher
+
+koios_api = lazy_import("koios_api")
+
+
+def _fetch_asset_info(asset_keys):
+    """Bulk Koios /asset_info for [(policy_id, asset_name_hex), ...]"""
+    response = requests.post(
+        f"{KOIOS_API_URL}/asset_info",
+        json={"_asset_list": [list(key) for key in asset_keys]},
+        headers=KOIOS_HEADERS,
+        timeout=UPSTREAM_TIMEOUT
+    )
+    response.raise_for_status()
+    return {
+        (asset.policy_id.lower(), (asset.asset_name or "").lower()): asset
+        for asset in decode_json(list[AssetInfo], response.content)
+    }
+
+
+def _fetch_address_info(addresses):
+    """Bulk Koios /address_info for a list of addresses"""
+    response = requests.post(
+        f"{KOIOS_API_URL}/address_info",
+        json={"_addresses": list(addresses)},
+        headers=KOIOS_HEADERS,
+        timeout=UPSTREAM_TIMEOUT
+    )
+    response.raise_for_status()
+    return {info.address: info for info in decode_json(list[AddressInfo], response.content)}
+
+
+def _fetch_coin_prices(coin_ids):
+    """Bulk CoinGecko /simple/price for a list of coin ids"""
+    response = requests.get(
+        f"{COINGECKO_API_URL}/simple/price",
+        params={
+            "ids": ",".join(coin_ids),
+            "vs_currencies": "usd",
+            "include_24hr_vol": "true",
+            "include_market_cap": "true"
+        },
+        timeout=UPSTREAM_TIMEOUT
+    )
+    response.raise_for_status()
+    return decode_json(dict[str, CoinPrice], response.content)
+
+
+def _is_client_error(error):
+    """A 4xx means the request itself was bad, e.g. one malformed address in the batch"""
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and response is not None and 400 <= response.status_code < 500
+
+
+_asset_info_batcher = MicroBatcher(_fetch_asset_info, is_key_error=_is_client_error)
+_address_info_batcher = MicroBatcher(_fetch_address_info, is_key_error=_is_client_error)
+_coin_price_batcher = MicroBatcher(_fetch_coin_prices, is_key_error=_is_client_error)
+
 
 class CardanoService:
     @staticmethod
@@ -8,42 +71,33 @@ class CardanoService:
         """Get the latest block information"""
         try:
             tip = koios_api.get_tip()
-            return tip[0] if tip else None
+            return decode_payload(ChainTip, tip[0]) if tip else None
         except Exception as e:
             return f"Error: {str(e)}"
 
     @staticmethod
     def get_ada_price(asset_list=None):
-        """Get both ADA price from CoinGecko and asset information from Koios"""
+        """
+        Get both ADA price from CoinGecko and asset information from Koios.
+        Concurrent calls from different users are batched into single upstream requests.
+        """
         if asset_list is None:
             asset_list = [["750900e4999ebe0d58f19b634768ba25e525aaf12403bfe8fe130501", "424f4f4b"]]
 
         try:
             # Get asset info from Koios
-            koios_response = requests.post(
-                f"{KOIOS_API_URL}/asset_info",
-                json={"_asset_list": asset_list},
-                headers=KOIOS_HEADERS
-            )
-            koios_response.raise_for_status()
-            asset_info = koios_response.json()
+            asset_keys = list(dict.fromkeys(
+                (policy_id.lower(), asset_name.lower()) for policy_id, asset_name in asset_list
+            ))
+            assets = _asset_info_batcher.get_many(asset_keys)
+            asset_info = [assets[key] for key in asset_keys if assets[key]]
 
             # Get price info from CoinGecko
-            price_response = requests.get(
-                f"{COINGECKO_API_URL}/simple/price",
-                params={
-                    "ids": "cardano",
-                    "vs_currencies": "usd",
-                    "include_24hr_vol": "true",
-                    "include_market_cap": "true"
-                }
-            )
-            price_response.raise_for_status()
-            price_data = price_response.json()
+            price_data = _coin_price_batcher.get_many(["cardano"])["cardano"]
 
             return {
                 "asset_info": asset_info,
-                "price_data": price_data.get("cardano", {})
+                "price_data": price_data
             }
         except Exception as e:
             return f"Error: {str(e)}"
@@ -55,15 +109,39 @@ class CardanoService:
             if not epoch_info or not isinstance(epoch_info, list):
                return "Error: Invalid response from API"
 
-            return epoch_info[0] if epoch_info else None
+            return decode_payload(EpochInfo, epoch_info[0]) if epoch_info else None
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    @staticmethod
+    def get_epoch_history(from_epoch=0):
+        """Bulk Koios /epoch_info for every epoch from `from_epoch` on, paged in ascending order"""
+        try:
+            epochs = []
+            while True:
+                response = requests.get(
+                    f"{KOIOS_API_URL}/epoch_info",
+                    params={
+                        "epoch_no": f"gte.{int(from_epoch)}",
+                        "order": "epoch_no.asc",
+                        "offset": len(epochs),
+                        "limit": EPOCH_HISTORY_PAGE_SIZE
+                    },
+                    headers=KOIOS_HEADERS,
+                    timeout=UPSTREAM_TIMEOUT
+                )
+                response.raise_for_status()
+                page = decode_json(list[EpochInfo], response.content)
+                epochs.extend(page)
+                if len(page) < EPOCH_HISTORY_PAGE_SIZE:
+                    return epochs
         except Exception as e:
             return f"Error: {str(e)}"
 
     @staticmethod
     def get_address_info(address):
-        """Get address information"""
+        """Get address information, batched with concurrent lookups from other users"""
         try:
-            address_info = koios_api.get_address_info([address])
-            return address_info[0] if address_info else None
+            return _address_info_batcher.get_many([address])[address]
         except Exception as e:
-            return f"Error: {str(e)}"
\ No newline at end of file
+            return f"Error: {str(e)}"
@@ -0,0 +1,125 @@
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config.settings import CHARTS_ENABLED, CHART_RENDER_WORKERS, CHART_FILE_ID_TTL
+from src.bot.utils.chart_renderer import render_fear_greed_chart, render_trending_chart
+from src.bot.utils.market_history import MarketHistory
+from src.bot.utils.shared_cache import shared_cache
+
+# Seconds to wait for a render, and for another request's render and upload of the same chart
+CHART_RENDER_TIMEOUT = 60
+CHART_WAIT_TIMEOUT = CHART_RENDER_TIMEOUT + 30
+
+
+class ChartService:
+    """
+    Send chart images without blocking handlers
+
+    Charts are rendered in a process pool and sent from a background thread.
+    Each chart is keyed by a hash of its input data: the first request for a data
+    version renders and uploads it, later requests re-send the Telegram file_id.
+    """
+
+    logger = logging.getLogger("ChartService")
+    _render_pool = None
+    _send_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chart-send")
+    _pending = {}  # key -> Future of the file_id, for versions being rendered and uploaded
+    _locks_guard = threading.Lock()
+
+    @classmethod
+    def send_fear_greed_chart(cls, bot, chat_id):
+        series = MarketHistory.fear_greed_series()
+        if len(series) < 2:
+            return
+        cls._send_async(bot, chat_id, "fear_greed", render_fear_greed_chart, (series,),
+                        "📈 Market sentiment over time")
+
+    @classmethod
+    def send_trending_chart(cls, bot, chat_id, period, pairs, tokens_mapping):
+        history = MarketHistory.trending_series(period, [pair.token_id for pair in pairs])
+        rows = [
+            [tokens_mapping.get(pair.token_id, "Unknown Token"), pair.price_change_percentage,
+             history[pair.token_id] or [[0, pair.current_period_closing_price, pair.current_period_volume]]]
+            for pair in pairs
+        ]
+        if not rows:
+            return
+        cls._send_async(bot, chat_id, f"trending_{period}", render_trending_chart, (rows, period),
+                        f"📊 Trending pairs ({period.upper()}) price & volume")
+
+    @classmethod
+    def _send_async(cls, bot, chat_id, kind, render, args, caption):
+        if not CHARTS_ENABLED:
+            return
+        cls._send_pool.submit(cls._send_chart, bot, chat_id, kind, render, args, caption)
+
+    @classmethod
+    def _render_executor(cls):
+        if cls._render_pool is None:
+            with cls._locks_guard:
+                if cls._render_pool is None:
+                    # spawn: forking a process that already runs handler threads is unsafe
+                    cls._render_pool = ProcessPoolExecutor(
+                        max_workers=CHART_RENDER_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return cls._render_pool
+
+    @classmethod
+    def _render(cls, render, args):
+        pool = cls._render_executor()
+        try:
+            return pool.submit(render, *args).result(timeout=CHART_RENDER_TIMEOUT)
+        except BrokenProcessPool:
+            # A crashed worker breaks the whole pool, start a fresh one for the next chart
+            with cls._locks_guard:
+                if cls._render_pool is pool:
+                    cls._render_pool = None
+            raise
+
+    @classmethod
+    def _send_chart(cls, bot, chat_id, kind, render, args, caption):
+        try:
+            digest = hashlib.sha1(json.dumps(args, sort_keys=True).encode()).hexdigest()[:16]
+            key = f"chart:file_id:{kind}:{digest}"
+
+            file_id = shared_cache.get(key)
+            if file_id:
+                bot.send_photo(chat_id, file_id, caption=caption)
+                return
+
+            # One render and upload per data version: the first request owns it, concurrent
+            # requests wait for its file_id (or its failure) instead of rendering again
+            with cls._locks_guard:
+                pending = cls._pending.get(key)
+                owner = pending is None
+                if owner:
+                    pending = cls._pending[key] = Future()
+
+            if not owner:
+                bot.send_photo(chat_id, pending.result(timeout=CHART_WAIT_TIMEOUT), caption=caption)
+                return
+
+            try:
+                file_id = shared_cache.get(key)
+                if file_id:
+                    bot.send_photo(chat_id, file_id, caption=caption)
+                else:
+                    png = cls._render(render, args)
+                    message = bot.send_photo(chat_id, io.BytesIO(png), caption=caption)
+                    file_id = message.photo[-1].file_id
+                    shared_cache.set(key, file_id, CHART_FILE_ID_TTL)
+                pending.set_result(file_id)
+            except Exception as e:
+                pending.set_exception(e)
+                raise
+            finally:
+                with cls._locks_guard:
+                    del cls._pending[key]
+        except Exception as e:
+            cls.logger.error(f"Error sending {kind} chart: {str(e)}")
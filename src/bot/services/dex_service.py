@@ -1,10 +1,51 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
 import requests
-from config.settings import DEXHUNTER_API_URL, DEXHUNTER_HEADERS
+from config.settings import (
+    DEXHUNTER_API_URL, DEXHUNTER_TOKENS_URL, DEXHUNTER_HEADERS, SHARED_CACHE_TTL,
+    DEXHUNTER_DEXES, DEXHUNTER_BLACKLISTED_DEXES, ESTIMATE_COMPARE_DEXES, ESTIMATE_CACHE_TTL,
+    DEXHUNTER_TIMEOUT, ESTIMATE_TIMEOUT, ESTIMATE_MAX_CONCURRENT, TRENDING_CHART_TOKENS
+)
+from src.bot.models.base import loads, decode_json, DecodeError, JSONDecodeError
+from src.bot.models.dexhunter import TrendingPair, SwapEstimate, FearGreed
+from src.bot.utils.market_history import MarketHistory
+from src.bot.utils.shared_cache import shared_cache
+
+# Quotes for the DEX comparison are fetched in parallel, one thread per DEX filter. A comparison
+# holds one of ESTIMATE_MAX_CONCURRENT slots until all its quotes finish, so every admitted
+# comparison has a thread for each of its quotes and never queues behind another user's
+_ESTIMATE_FILTERS = len(ESTIMATE_COMPARE_DEXES) + 1
+_estimate_executor = ThreadPoolExecutor(
+    max_workers=ESTIMATE_MAX_CONCURRENT * _ESTIMATE_FILTERS, thread_name_prefix="swap-estimate"
+)
+_estimate_slots = threading.BoundedSemaphore(ESTIMATE_MAX_CONCURRENT)
+
+# Seconds a comparison waits for a free slot before replying that the bot is busy
+ESTIMATE_SLOT_WAIT = 2
 
 class DexHunterService:
     @staticmethod
     def get_trending(period="5m"):
-        """Get trending pairs from DexHunter"""
+        """Get trending pairs from DexHunter, shared between bot processes for a short TTL"""
+        fetched = []
+
+        def fetch():
+            fetched.append(True)
+            return DexHunterService._fetch_trending(period)
+
+        pairs = shared_cache.get_or_fetch(
+            f"dexhunter:trending:{period}", SHARED_CACHE_TTL, fetch, list[TrendingPair]
+        )
+
+        # Sample the chart history once per upstream refresh
+        if fetched and not isinstance(pairs, str):
+            MarketHistory.record_trending(period, pairs[:TRENDING_CHART_TOKENS])
+        return pairs
+
+    @staticmethod
+    def _fetch_trending(period):
         url = f"{DEXHUNTER_API_URL}/swap/trending"
         payload = {
             "sort": "VOLUME_AMOUNT",
@@ -12,41 +53,167 @@ class DexHunterService:
         }
 
         try:
-            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS)
+            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS, timeout=DEXHUNTER_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return decode_json(list[TrendingPair], response.content)
+        except (requests.exceptions.RequestException, DecodeError) as e:
             return f"Error: {str(e)}"
 
     @staticmethod
-    def get_swap_estimate(amount_in, token_in="", token_out="", slippage=5):
-        """Get swap estimate from DexHunter"""
+    def get_swap_estimate(amount_in, token_in="", token_out="", slippage=5, blacklisted_dexes=None):
+        """Get swap estimate from DexHunter, cached briefly per DEX filter"""
+        if blacklisted_dexes is None:
+            blacklisted_dexes = DEXHUNTER_BLACKLISTED_DEXES
+        blacklisted_dexes = sorted(blacklisted_dexes)
+
+        key = (f"dexhunter:estimate:{float(amount_in)}:{token_in}:{token_out}:{slippage}:"
+               f"{','.join(blacklisted_dexes)}")
+        return shared_cache.get_or_fetch(
+            key, ESTIMATE_CACHE_TTL,
+            lambda: DexHunterService._fetch_swap_estimate(
+                amount_in, token_in, token_out, slippage, blacklisted_dexes
+            ),
+            SwapEstimate
+        )
+
+    @staticmethod
+    def _submit_estimates(amount_in, token_in, token_out, slippage, deadline):
+        """
+        Start one quote per DEX filter: the default aggregated route and each ESTIMATE_COMPARE_DEXES entry.
+        Returns None if no comparison slot frees up in time.
+        """
+        wait = min(ESTIMATE_SLOT_WAIT, max(0.0, deadline - time.monotonic()))
+        if not _estimate_slots.acquire(timeout=wait):
+            return None
+
+        filters = {"Best route": DEXHUNTER_BLACKLISTED_DEXES}
+        for label, dexes in ESTIMATE_COMPARE_DEXES.items():
+            filters[label] = [dex for dex in DEXHUNTER_DEXES if dex not in dexes]
+
+        # The slot is released once every quote has finished or been cancelled
+        pending = [len(filters)]
+        pending_lock = threading.Lock()
+
+        def quote_done(__):
+            with pending_lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            _estimate_slots.release()
+
+        futures = {}
+        for label, blacklist in filters.items():
+            futures[label] = _estimate_executor.submit(
+                DexHunterService.get_swap_estimate, amount_in, token_in, token_out, slippage, blacklist
+            )
+            futures[label].add_done_callback(quote_done)
+        return futures
+
+    @staticmethod
+    def _collect_estimates(futures, deadline):
+        """[(label, estimate or error string)], cancelling quotes still pending at `deadline`"""
+        if futures is None:
+            return [("Best route", "Error: Too many estimates in progress, try again in a few seconds")]
+
+        results = []
+        for label, future in futures.items():
+            try:
+                results.append((label, future.result(timeout=max(0.0, deadline - time.monotonic()))))
+            except FutureTimeoutError:
+                future.cancel()
+                results.append((label, "Error: Quote timed out"))
+            except Exception as e:
+                results.append((label, f"Error: {str(e)}"))
+        return results
+
+    @staticmethod
+    def compare_swap_estimates(amount_in, token_in="", token_out="", slippage=5, deadline=None):
+        """
+        Quote the swap through every DEX in ESTIMATE_COMPARE_DEXES and through the
+        default aggregated route, all at once.
+
+        Returns a list of (label, estimate or error string) in configuration order.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + ESTIMATE_TIMEOUT
+        futures = DexHunterService._submit_estimates(amount_in, token_in, token_out, slippage, deadline)
+        return DexHunterService._collect_estimates(futures, deadline)
+
+    @staticmethod
+    def compare_swap_directions(amount_in, token, slippage=5):
+        """
+        Like compare_swap_estimates for a swap between `token` and ADA when the direction
+        is not given: selling `token` is quoted first, buying it only if no DEX routes the sale.
+
+        Returns (token_in, token_out, quotes) for the chosen direction.
+        """
+        deadline = time.monotonic() + ESTIMATE_TIMEOUT
+        quotes = DexHunterService.compare_swap_estimates(amount_in, token, "", slippage, deadline)
+        if any(not isinstance(quote, str) for __, quote in quotes):
+            return token, "", quotes
+        return "", token, DexHunterService.compare_swap_estimates(amount_in, "", token, slippage, deadline)
+
+    @staticmethod
+    def _fetch_swap_estimate(amount_in, token_in, token_out, slippage, blacklisted_dexes):
         url = f"{DEXHUNTER_API_URL}/swap/estimate"
         payload = {
             "amount_in": float(amount_in),
             "token_in": token_in,
             "token_out": token_out,
             "slippage": slippage,
-            "blacklisted_dexes": ["CERRA", "MUESLISWAP", "GENIUS"]
+            "blacklisted_dexes": blacklisted_dexes
         }
 
         try:
-            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS)
+            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS, timeout=DEXHUNTER_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return decode_json(SwapEstimate, response.content)
+        except (requests.exceptions.RequestException, DecodeError) as e:
             return f"Error: {str(e)}"
 
     @staticmethod
     def get_fear_greed():
+        return shared_cache.get_or_fetch(
+            "dexhunter:fear_greed:24h", SHARED_CACHE_TTL, DexHunterService._fetch_fear_greed, list[FearGreed]
+        )
+
+    @staticmethod
+    def _fetch_fear_greed():
         url = f"{DEXHUNTER_API_URL}/stats/fear_and_greed"
         payload = {
             "period": "24h"
         }
 
         try:
-            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS)
+            response = requests.post(url, json=payload, headers=DEXHUNTER_HEADERS, timeout=DEXHUNTER_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return f"Error: {str(e)}"
\ No newline at end of file
+            return decode_json(list[FearGreed], response.content)
+        except (requests.exceptions.RequestException, DecodeError) as e:
+            return f"Error: {str(e)}"
+
+    @staticmethod
+    def get_token_list(etag=None, last_modified=None):
+        """
+        Get the DexHunter token list as a conditional request.
+
+        Returns a dict with "tokens" (None when unchanged since `etag`/`last_modified`)
+        and the response's "etag" and "last_modified" validators for the next call.
+        """
+        headers = dict(DEXHUNTER_HEADERS)
+        if etag:
+            headers["if-none-match"] = etag
+        if last_modified:
+            headers["if-modified-since"] = last_modified
+
+        try:
+            response = requests.get(DEXHUNTER_TOKENS_URL, headers=headers, timeout=DEXHUNTER_TIMEOUT)
+            if response.status_code == 304:
+                return {"tokens": None, "etag": etag, "last_modified": last_modified}
+            response.raise_for_status()
+            return {
+                "tokens": loads(response.content),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified")
+            }
+        except (requests.exceptions.RequestException, JSONDecodeError) as e:
+            return f"Error: {str(e)}"
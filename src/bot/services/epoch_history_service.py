@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+
+from config.settings import EPOCH_HISTORY_PATH, EPOCH_HISTORY_REFRESH
+from src.bot.services.cardano_service import CardanoService
+from src.bot.utils.epoch_history import EpochHistory, EPOCH_FIELDS
+from src.bot.utils.snapshot import read_snapshot, write_snapshot
+
+# Layout version of the epoch history snapshot
+SNAPSHOT_VERSION = 1
+
+# Stake and rewards for an epoch are filled in up to two epochs later, so the
+# newest epochs are always re-fetched on refresh
+REFRESH_OVERLAP = 3
+
+# After a failed refresh keep serving the stored history and retry this much later
+RETRY_DELAY = 60
+
+
+class EpochHistoryService:
+    """
+    Epoch history for range analytics, bulk-fetched from Koios once and then
+    topped up incrementally. Stored column-wise in a marshal snapshot shared by
+    the bot processes and served from an in-memory EpochHistory.
+    """
+
+    logger = logging.getLogger("EpochHistoryService")
+    _history = None
+    _fetched_at = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _merge(columns, epochs):
+        """Overlay fetched EpochInfo models on the stored columns, ordered by epoch"""
+        rows = {}
+        if columns:
+            for row in zip(*(columns[field] for field in EPOCH_FIELDS)):
+                rows[row[0]] = row
+        for epoch in epochs:
+            rows[epoch.epoch_no] = tuple(getattr(epoch, field) for field in EPOCH_FIELDS)
+
+        ordered = [rows[epoch_no] for epoch_no in sorted(rows)]
+        return {field: tuple(row[i] for row in ordered) for i, field in enumerate(EPOCH_FIELDS)}
+
+    @staticmethod
+    def _read_snapshot():
+        snapshot = read_snapshot(EPOCH_HISTORY_PATH, SNAPSHOT_VERSION)
+        if snapshot and "fetched_at" in snapshot and "epochs" in snapshot:
+            return snapshot["fetched_at"], snapshot["epochs"]
+        return 0, None
+
+    @staticmethod
+    def _write_snapshot(fetched_at, columns):
+        try:
+            write_snapshot(EPOCH_HISTORY_PATH, SNAPSHOT_VERSION, fetched_at=fetched_at, epochs=columns)
+        except OSError as e:
+            # Read-only deployments keep the history in memory only
+            EpochHistoryService.logger.warning(f"Could not write epoch history snapshot: {str(e)}")
+
+    @staticmethod
+    def _publish(fetched_at, columns):
+        EpochHistoryService._history = EpochHistory(columns)
+        EpochHistoryService._fetched_at = fetched_at
+
+    @staticmethod
+    def refresh():
+        """
+        Load the snapshot, or if it is older than EPOCH_HISTORY_REFRESH fetch the
+        epochs after it (all epochs on the first run) and rewrite it.
+        Returns an error string if no history could be loaded.
+        """
+        fetched_at, columns = EpochHistoryService._read_snapshot()
+        if columns and time.time() - fetched_at < EPOCH_HISTORY_REFRESH:
+            # Another process refreshed it already
+            EpochHistoryService._publish(fetched_at, columns)
+            return None
+
+        from_epoch = max(0, columns["epoch_no"][-1] - REFRESH_OVERLAP) if columns and columns["epoch_no"] else 0
+        epochs = CardanoService.get_epoch_history(from_epoch)
+        if isinstance(epochs, str):
+            EpochHistoryService.logger.error(f"Failed to fetch epoch history: {epochs}")
+            if not columns:
+                return epochs
+            EpochHistoryService._publish(time.time() - EPOCH_HISTORY_REFRESH + RETRY_DELAY, columns)
+            return None
+
+        fetched_at = time.time()
+        columns = EpochHistoryService._merge(columns, epochs)
+        EpochHistoryService._write_snapshot(fetched_at, columns)
+        EpochHistoryService._publish(fetched_at, columns)
+        return None
+
+    @staticmethod
+    def get_history():
+        """
+        Return the EpochHistory, refreshing it when stale. Only one thread refreshes;
+        the others keep reading the previous history meanwhile.
+        """
+        history = EpochHistoryService._history
+        if history is not None and time.time() - EpochHistoryService._fetched_at < EPOCH_HISTORY_REFRESH:
+            return history
+
+        if not EpochHistoryService._lock.acquire(blocking=history is None):
+            return history
+        try:
+            if (EpochHistoryService._history is None
+                    or time.time() - EpochHistoryService._fetched_at >= EPOCH_HISTORY_REFRESH):
+                error = EpochHistoryService.refresh()
+                if error:
+                    return error
+        except Exception as e:
+            if EpochHistoryService._history is None:
+                return f"Error: {str(e)}"
+            EpochHistoryService.logger.error(f"Error refreshing epoch history: {str(e)}")
+        finally:
+            EpochHistoryService._lock.release()
+
+        return EpochHistoryService._history
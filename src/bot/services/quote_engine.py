@@ -0,0 +1,73 @@
+from config.settings import LADDER_PROBE_AMOUNT, LADDER_POOL_TTL
+from src.bot.services.dex_service import DexHunterService
+from src.bot.utils.shared_cache import shared_cache
+
+
+class QuoteEngine:
+    """
+    Local constant-product quotes for many trade sizes from one set of pool snapshots
+
+    Pool reserves are not exposed by the estimate API, so they are derived from a
+    probe estimate per DEX: for a split with input x, pool fee f, output y (before
+    slippage) and price impact p, the effective input is x' = x * (1 - f) and
+
+        p = x' / (R_in + x')   =>   R_in = x' * (1 - p) / p,   R_out = y / p
+    """
+
+    @staticmethod
+    def derive_pool(split, amount_in):
+        """Derive a reserve snapshot from one estimate split, or None if it can't be inverted"""
+        amount = split.amount_in or amount_in
+        fee, impact, output = split.pool_fee, split.price_impact, split.expected_output_without_slippage
+        if amount is None or amount <= 0 or output <= 0 or not 0 < impact < 1 or not 0 <= fee < 1:
+            return None
+
+        effective_in = amount * (1 - fee)
+        return {
+            "dex": split.dex,
+            "fee": fee,
+            "reserve_in": effective_in * (1 - impact) / impact,
+            "reserve_out": output / impact
+        }
+
+    @staticmethod
+    def get_pools(token, probe_amount=LADDER_PROBE_AMOUNT):
+        """Pool snapshots for buying `token` with ADA, refreshed at most once per LADDER_POOL_TTL"""
+        def fetch():
+            pools = {}
+            quotes = DexHunterService.compare_swap_estimates(probe_amount, token_in="", token_out=token)
+            for __, quote in quotes:
+                if isinstance(quote, str):
+                    continue
+                splits = quote.splits
+                for split in splits:
+                    pool = QuoteEngine.derive_pool(split, probe_amount if len(splits) == 1 else None)
+                    if pool:
+                        # The aggregated route reuses the per-DEX pools, keep one snapshot per pool
+                        pools.setdefault((pool['dex'], split.pool_id), pool)
+            return list(pools.values()) or "Error: No pool data available for this token"
+
+        return shared_cache.get_or_fetch(f"quote_engine:pools:{token}", LADDER_POOL_TTL, fetch)
+
+    @staticmethod
+    def quote_ladder(pools, amounts):
+        """
+        Quote every amount against every pool in one pass and keep the best pool per amount
+
+        Returns a list of dicts with amount_in, amount_out, price_impact and dex.
+        """
+        best = [None] * len(amounts)
+        for pool in pools:
+            reserve_in, reserve_out, keep = pool['reserve_in'], pool['reserve_out'], 1 - pool['fee']
+            effective = [amount * keep for amount in amounts]
+            outputs = [reserve_out * x / (reserve_in + x) for x in effective]
+
+            for i, output in enumerate(outputs):
+                if best[i] is None or output > best[i]['amount_out']:
+                    best[i] = {
+                        "amount_in": amounts[i],
+                        "amount_out": output,
+                        "price_impact": effective[i] / (reserve_in + effective[i]),
+                        "dex": pool['dex']
+                    }
+        return best
@@ -0,0 +1,138 @@
+# services/token_sync_service.py
+import threading
+import time
+import logging
+
+from config.settings import TOKEN_SYNC_INTERVAL
+from src.bot.services.dex_service import DexHunterService
+from src.bot.utils.leader_lease import LeaderLease
+from src.bot.utils.mapping_token_name import FormatTokenName, TOKEN_FIELDS
+
+# How often the lease is renewed and followers look for a new snapshot
+SYNC_TICK = 60
+
+
+class TokenSyncService:
+    """
+    Keep the token registry in sync with the DexHunter token list in the background
+
+    Only the process holding the "token_sync" lease polls upstream and writes the
+    snapshot; the other bot processes reload the snapshot when it changes.
+    """
+
+    def __init__(self, interval=TOKEN_SYNC_INTERVAL):
+        self.interval = interval
+        self.dex_service = DexHunterService()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.is_running = False
+        self.etag = None
+        self.last_modified = None
+        self.lease = LeaderLease("token_sync")
+        self.next_sync = 0
+        self.snapshot_signature = None
+
+    def start(self):
+        """Start the token sync service"""
+        if not self.is_running and self.interval > 0:
+            self.is_running = True
+            self.snapshot_signature = FormatTokenName.snapshot_signature()
+            thread = threading.Thread(target=self._run_sync_worker)
+            thread.daemon = True
+            thread.start()
+            self.logger.info("Token sync service started")
+
+    def stop(self):
+        """Stop the token sync service"""
+        self.is_running = False
+        self.lease.release()
+        self.logger.info("Token sync service stopped")
+
+    def _run_sync_worker(self):
+        while self.is_running:
+            try:
+                if self.lease.acquire():
+                    if time.time() >= self.next_sync:
+                        self.sync()
+                        self.next_sync = time.time() + self.interval
+                else:
+                    self.reload()
+                time.sleep(min(SYNC_TICK, self.interval))
+            except Exception as e:
+                self.logger.error(f"Error in token sync worker: {str(e)}")
+                time.sleep(60)  # Wait a minute before retrying if there's an error
+
+    def sync(self):
+        """
+        Fetch the token list (conditionally), apply only the tokens that changed
+        and hot-swap the registry. Returns the number of tokens added or updated.
+        """
+        result = self.dex_service.get_token_list(self.etag, self.last_modified)
+        if isinstance(result, str):
+            self.logger.error(f"Failed to fetch token list: {result}")
+            return 0
+
+        if result["tokens"] is None:
+            return 0
+
+        # The validators are only kept once the list is applied, otherwise a failed
+        # merge or swap would be skipped by every later 304
+        validators = result["etag"], result["last_modified"]
+        current = FormatTokenName.load_token_index()
+        changes = self._diff(current, result["tokens"])
+        # Drop the full upstream payload before building the new index to keep peak memory down
+        del result
+        if not changes:
+            self.etag, self.last_modified = validators
+            return 0
+
+        tokens = self._merge(current.tokens, changes)
+        FormatTokenName.swap_token_index(tokens)
+        self.etag, self.last_modified = validators
+        try:
+            FormatTokenName.write_snapshot(tokens)
+            self.snapshot_signature = FormatTokenName.snapshot_signature()
+        except OSError as e:
+            self.logger.error(f"Failed to persist token snapshot: {str(e)}")
+        self.logger.info(f"Token registry updated: {len(changes)} tokens added or changed")
+        return len(changes)
+
+    def reload(self):
+        """Swap in the snapshot if another process rewrote it. Returns True if it was reloaded."""
+        signature = FormatTokenName.snapshot_signature()
+        if signature is None or signature == self.snapshot_signature:
+            return False
+
+        self.snapshot_signature = signature
+        FormatTokenName.swap_token_index(FormatTokenName.load_tokens())
+        self.logger.info("Token registry reloaded from snapshot")
+        return True
+
+    @staticmethod
+    def _diff(current, upstream_tokens):
+        """Tokens from the upstream list that are new or differ from the current registry"""
+        rows = {token_id: row for row, token_id in enumerate(current.ids)}
+        changes = []
+        for token in upstream_tokens:
+            token_id = token.get("token_id")
+            if not token_id:
+                continue
+            record = tuple(token.get(field) for field in TOKEN_FIELDS)
+            row = rows.get(token_id)
+            if row is None or record != tuple(current.tokens[field][row] for field in TOKEN_FIELDS):
+                changes.append(record)
+        return changes
+
+    @staticmethod
+    def _merge(tokens, changes):
+        columns = {field: list(tokens[field]) for field in TOKEN_FIELDS}
+        rows = {token_id: row for row, token_id in enumerate(columns["token_id"])}
+        for record in changes:
+            row = rows.get(record[0])
+            for field, value in zip(TOKEN_FIELDS, record):
+                if row is None:
+                    columns[field].append(value)
+                else:
+                    columns[field][row] = value
+            if row is None:
+                rows[record[0]] = len(columns["token_id"]) - 1
+        return {field: tuple(values) for field, values in columns.items()}
@@ -6,6 +6,9 @@ from datetime import datetime
 
 from config.settings import CHANNEL_ID
 from src.bot.services.dex_service import DexHunterService
+from src.bot.utils.leader_lease import LeaderLease
+from src.bot.utils.market_history import MarketHistory
+from src.bot.utils.shared_cache import shared_cache
 
 class WorkerService:
     def __init__(self, bot):
@@ -13,8 +16,17 @@ class WorkerService:
         self.dex_service = DexHunterService()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.is_running = False
-        self.last_value = None
         self.channel_id = CHANNEL_ID
+        self.lease = LeaderLease("channel_worker")
+
+    @property
+    def last_value(self):
+        """Last value posted to the channel, persisted so restarts don't re-post"""
+        return shared_cache.get(f"fear_greed:last_value:{self.channel_id}")
+
+    @last_value.setter
+    def last_value(self, value):
+        shared_cache.set(f"fear_greed:last_value:{self.channel_id}", value)
 
     def start(self):
         """Start the worker service"""
@@ -28,12 +40,16 @@ class WorkerService:
     def stop(self):
         """Stop the worker service"""
         self.is_running = False
+        self.lease.release()
         self.logger.info("Fear and Greed worker service stopped")
 
     def _run_fear_greed_worker(self):
         while self.is_running:
             try:
-                self._process_fear_greed_data()
+                # Only the process holding the lease posts to the channel and purges the shared cache
+                if self.lease.acquire():
+                    self._process_fear_greed_data()
+                    shared_cache.purge_expired()
                 time.sleep(60)  # Wait for 1 minute
             except Exception as e:
                 self.logger.error(f"Error in fear and greed worker: {str(e)}")
@@ -57,8 +73,8 @@ class WorkerService:
             message = self._format_fear_greed_message(latest_data)
             print(message)
             # Calculate current value based on buy/sell volumes
-            buy_volume = latest_data.get('global_buy_volume', 0)
-            sell_volume = latest_data.get('global_sell_volume', 0)
+            buy_volume = latest_data.global_buy_volume
+            sell_volume = latest_data.global_sell_volume
             total_volume = buy_volume + sell_volume
 
             if total_volume > 0:
@@ -67,7 +83,11 @@ class WorkerService:
             else:
                 current_value = 50  # Default neutral value
 
-            if current_value != self.last_value:
+            MarketHistory.record_fear_greed(current_value)
+
+            # Renew the lease right before posting: if the fetch stalled past its TTL,
+            # another process may have taken over and will post this value instead
+            if current_value != self.last_value and self.lease.acquire():
                 self.bot.send_message(self.channel_id, message, parse_mode='HTML')
                 self.last_value = current_value
                 self.logger.info(f"Fear and Greed update sent: {current_value}")
@@ -78,8 +98,8 @@ class WorkerService:
     def _format_fear_greed_message(self, data):
         """Format fear and greed message with beautiful styling"""
         # Calculate buy/sell ratio
-        buy_volume = data.get('global_buy_volume', 0)
-        sell_volume = data.get('global_sell_volume', 0)
+        buy_volume = data.global_buy_volume
+        sell_volume = data.global_sell_volume
         total_volume = buy_volume + sell_volume
 
         if total_volume > 0:
@@ -147,9 +167,9 @@ class WorkerService:
             f"• Total Volume: {total_vol_formatted}\n\n"
 
             f"📈 <b>Trade Statistics</b>\n"
-            f"• Buy Orders:  {data.get('global_buy_count', 0):,}\n"
-            f"• Sell Orders: {data.get('global_sell_count', 0):,}\n"
-            f"• Total Trades: {data.get('count', 0):,}\n\n"
+            f"• Buy Orders:  {data.global_buy_count:,}\n"
+            f"• Sell Orders: {data.global_sell_count:,}\n"
+            f"• Total Trades: {data.count:,}\n\n"
 
             "━━━━━━━━━━━━━━━━━━━━━\n"
             f"🕒 <i>Last Updated: {timestamp}</i>\n"
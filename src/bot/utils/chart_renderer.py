@@ -0,0 +1,97 @@
+"""
+PNG chart rendering, run inside the chart process pool.
+
+Kept free of bot/service imports so worker processes start quickly; matplotlib
+is imported on the first render in each worker.
+"""
+import io
+from datetime import datetime
+
+# Sentiment bands, matching the classification used in the fear & greed message
+SENTIMENT_BANDS = (
+    (0, 25, "#3b82f6"),
+    (25, 40, "#facc15"),
+    (40, 60, "#9ca3af"),
+    (60, 75, "#f97316"),
+    (75, 100, "#ef4444"),
+)
+
+
+def _figure(width, height):
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=(width, height), dpi=100)
+
+
+def _to_png(figure):
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def render_fear_greed_chart(series):
+    """
+    Args:
+        series (list): [[timestamp, value 0-100], ...] oldest first
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(8, 3.5)
+    axes = figure.subplots()
+
+    for low, high, color in SENTIMENT_BANDS:
+        axes.axhspan(low, high, color=color, alpha=0.12, linewidth=0)
+
+    times = [datetime.fromtimestamp(timestamp) for timestamp, __ in series]
+    values = [value for __, value in series]
+    axes.plot(times, values, color="#111827", linewidth=1.6)
+    axes.fill_between(times, values, 50, color="#111827", alpha=0.08)
+
+    axes.set_ylim(0, 100)
+    axes.set_ylabel("Buy ratio %")
+    axes.set_title(f"Market Sentiment Index - now {values[-1]}%")
+    axes.grid(alpha=0.3)
+    figure.autofmt_xdate()
+    return _to_png(figure)
+
+
+def render_trending_chart(rows, period):
+    """
+    Args:
+        rows (list): [[name, price_change, [[timestamp, price, volume], ...]], ...]
+        period (str): Trending period label
+
+    Returns:
+        bytes: PNG image with one price/volume sparkline per token
+    """
+    columns = 2
+    lines = (len(rows) + columns - 1) // columns
+    figure = _figure(8, 1.6 * lines)
+    figure.suptitle(f"Trending pairs ({period.upper()}) - price & volume")
+    grid = figure.subplots(lines, columns, squeeze=False)
+
+    for index, axes in enumerate(grid.flat):
+        if index >= len(rows):
+            axes.set_visible(False)
+            continue
+
+        name, price_change, samples = rows[index]
+        color = "#16a34a" if price_change > 0 else "#dc2626" if price_change < 0 else "#6b7280"
+        steps = list(range(len(samples)))
+
+        volume_axes = axes.twinx()
+        volume_axes.bar(steps, [volume for __, __, volume in samples], color="#93c5fd", alpha=0.5, width=0.8)
+        volume_axes.set_yticks([])
+
+        axes.plot(steps, [price for __, price, __ in samples], color=color, linewidth=1.5, marker="." if len(samples) < 3 else None)
+        axes.set_zorder(volume_axes.get_zorder() + 1)
+        axes.patch.set_visible(False)
+        axes.set_title(f"#{index + 1} {name}  {price_change:+.2f}%", fontsize=9, loc="left")
+        axes.set_xticks([])
+        axes.tick_params(axis="y", labelsize=7)
+
+    figure.tight_layout()
+    return _to_png(figure)
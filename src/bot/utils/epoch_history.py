@@ -0,0 +1,91 @@
+import bisect
+
+# Columns kept per epoch, epoch_no first; the rest are the metrics /epoch_range reports
+EPOCH_FIELDS = ("epoch_no", "tx_count", "blk_count", "fees", "out_sum", "active_stake", "total_rewards")
+METRICS = EPOCH_FIELDS[1:]
+
+
+class EpochHistory:
+    """
+    Precomputed aggregates over the epoch history columns
+
+    Prefix sums (and prefix counts, since stake and rewards are null until Koios
+    calculates them) give range totals and averages in O(1), and the per-epoch
+    deltas are computed once so range queries only slice ready-made columns.
+    Read-only after construction, swapped out wholesale when the history changes.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.epochs = columns["epoch_no"]
+        self._totals = {}
+        self._counts = {}
+        self.deltas = {}
+
+        for field in METRICS:
+            values = columns[field]
+            totals, counts = [0], [0]
+            for value in values:
+                totals.append(totals[-1] + (value or 0))
+                counts.append(counts[-1] + (value is not None))
+            self._totals[field] = totals
+            self._counts[field] = counts
+            self.deltas[field] = (None,) + tuple(
+                None if previous is None or value is None else value - previous
+                for previous, value in zip(values, values[1:])
+            )
+
+    def __len__(self):
+        return len(self.epochs)
+
+    @property
+    def latest_epoch(self):
+        return self.epochs[-1] if self.epochs else None
+
+    def range_stats(self, start, end):
+        """
+        Aggregate every metric over epochs start..end (inclusive, clamped to the history)
+
+        Returns None if no stored epoch falls in the range, otherwise a dict with
+        from/to/count and per metric: total, average, first, last, change (%),
+        peak (value, epoch) and jump (largest epoch-over-epoch increase, epoch).
+        """
+        lo = bisect.bisect_left(self.epochs, start)
+        hi = bisect.bisect_right(self.epochs, end)
+        if lo >= hi:
+            return None
+
+        metrics = {}
+        for field in METRICS:
+            count = self._counts[field][hi] - self._counts[field][lo]
+            if not count:
+                metrics[field] = None
+                continue
+
+            values = self.columns[field][lo:hi]
+            total = self._totals[field][hi] - self._totals[field][lo]
+            present = [(value, row) for row, value in enumerate(values, lo) if value is not None]
+            first, last = present[0][0], present[-1][0]
+            peak_value, peak_row = max(present)
+
+            # The first epoch's delta points outside the range, so jumps start one row in
+            deltas = [(delta, row) for row, delta in enumerate(self.deltas[field][lo + 1:hi], lo + 1)
+                      if delta is not None]
+            jump = max(deltas) if deltas else None
+
+            metrics[field] = {
+                "total": total,
+                "average": total / count,
+                "first": first,
+                "last": last,
+                "change": (last - first) / first * 100 if first else None,
+                "peak": (peak_value, self.epochs[peak_row]),
+                "jump": (jump[0], self.epochs[jump[1]]) if jump else None
+            }
+
+        return {
+            "from": self.epochs[lo],
+            "to": self.epochs[hi - 1],
+            "count": hi - lo,
+            "metrics": metrics
+        }
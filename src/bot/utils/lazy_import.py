@@ -0,0 +1,40 @@
+import importlib
+import importlib.util
+import sys
+import types
+
+from config.settings import LAZY_IMPORTS
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Placeholder that imports the real module on first attribute access
+
+    The import goes through importlib.import_module, which holds the module's
+    import lock, so handler threads racing on the first access all see the fully
+    executed module (importlib's LazyLoader is not thread-safe before 3.12).
+    """
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self.__name__), attr)
+
+
+def lazy_import(name: str):
+    """
+    Import a module so that its body only runs on first attribute access
+
+    Args:
+        name (str): Absolute module name (e.g. "koios_api")
+
+    Returns:
+        module: The module, or a lazy placeholder that loads it when used.
+        With LAZY_IMPORTS disabled this is a plain import.
+    """
+    if not LAZY_IMPORTS or name in sys.modules:
+        return importlib.import_module(name)
+
+    # Fail at startup, not on first use, if the module is missing
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    return _LazyModule(name)
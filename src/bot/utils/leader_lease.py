@@ -0,0 +1,48 @@
+import os
+import socket
+import time
+import uuid
+
+from config.settings import LEADER_LEASE_TTL
+from src.bot.utils.shared_cache import shared_cache
+
+
+class LeaderLease:
+    """
+    Lease-based leader election over the shared SQLite cache
+
+    Exactly one holder owns a named lease at a time. The holder has to renew it
+    (by calling `acquire()` again) before `ttl` seconds pass, otherwise another
+    process takes over.
+    """
+
+    def __init__(self, name: str, ttl: float = LEADER_LEASE_TTL, cache=shared_cache):
+        self.name = name
+        self.ttl = ttl
+        self.cache = cache
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _ensure_table(self, conn):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def acquire(self) -> bool:
+        """Acquire or renew the lease, returning True if this process is the leader"""
+        conn = self.cache.connection()
+        self._ensure_table(conn)
+        now = time.time()
+        conn.execute(
+            "INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE leases.owner = excluded.owner OR leases.expires_at <= ?",
+            (self.name, self.owner, now + self.ttl, now)
+        )
+        row = conn.execute("SELECT owner FROM leases WHERE name = ?", (self.name,)).fetchone()
+        return row is not None and row[0] == self.owner
+
+    def release(self):
+        conn = self.cache.connection()
+        self._ensure_table(conn)
+        conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (self.name, self.owner))
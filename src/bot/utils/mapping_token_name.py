@@ -1,19 +1,107 @@
 import json
+import os
+
+from config.settings import TOKENS_PATH, TOKENS_SNAPSHOT_PATH
+from src.bot.utils.snapshot import read_snapshot, write_snapshot
+from src.bot.utils.token_index import TokenIndex
+
+# Bump when the snapshot layout changes so stale snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
+# Only the fields the bot reads are kept in the snapshot, stored column-wise
+TOKEN_FIELDS = ("token_id", "token_ascii", "ticker", "token_decimals", "is_verified")
+
 
 class FormatTokenName:
+    _token_index = None
+
+    @staticmethod
+    def _source_signature():
+        stat = os.stat(TOKENS_PATH)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def snapshot_signature():
+        """(mtime_ns, size) of the snapshot file, or None if there is none yet"""
+        try:
+            stat = os.stat(TOKENS_SNAPSHOT_PATH)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _to_columns(tokens_data):
+        return {
+            field: tuple(token.get(field) for token in tokens_data) for field in TOKEN_FIELDS
+        }
+
+    @staticmethod
+    def write_snapshot(tokens):
+        """Write token columns to the binary snapshot, tagged with the current tokens.json version."""
+        write_snapshot(
+            TOKENS_SNAPSHOT_PATH, SNAPSHOT_VERSION,
+            source=FormatTokenName._source_signature(), tokens=tokens
+        )
+
+    @staticmethod
+    def build_snapshot():
+        """Parse tokens.json once and write the compact binary snapshot next to it."""
+        with open(TOKENS_PATH, "r") as tokens_file:
+            tokens_data = json.load(tokens_file)
+
+        tokens = FormatTokenName._to_columns(tokens_data)
+        FormatTokenName.write_snapshot(tokens)
+        return tokens
+
+    @staticmethod
+    def load_tokens():
+        """
+        Load token columns ({field: tuple of values}) from the snapshot,
+        rebuilding it if tokens.json changed.
+        """
+        snapshot = read_snapshot(TOKENS_SNAPSHOT_PATH, SNAPSHOT_VERSION)
+        try:
+            if snapshot and tuple(snapshot.get("source", ())) == FormatTokenName._source_signature():
+                return snapshot["tokens"]
+        except (OSError, KeyError, TypeError):
+            pass
+
+        try:
+            return FormatTokenName.build_snapshot()
+        except OSError:
+            # Read-only deployments can still serve from tokens.json
+            with open(TOKENS_PATH, "r") as tokens_file:
+                return FormatTokenName._to_columns(json.load(tokens_file))
+
+    @staticmethod
+    def load_token_index():
+        """Load the token search index, built once and cached after the first call."""
+        if FormatTokenName._token_index is None:
+            FormatTokenName._token_index = TokenIndex(FormatTokenName.load_tokens())
+        return FormatTokenName._token_index
+
+    @staticmethod
+    def swap_token_index(tokens):
+        """
+        Build an index for new token columns and publish it with a single reference
+        assignment, so handlers see either the old or the new registry, never a mix.
+        """
+        token_index = TokenIndex(tokens)
+        FormatTokenName._token_index = token_index
+        return token_index
+
     @staticmethod
     def load_token_name():
-        """Load tokens data from the JSON file and create a mapping dictionary."""
+        """Load tokens data and return the mapping dictionary {token_id: token_ascii}."""
         try:
-            with open("src/bot/tokens.json", "r") as tokens_file:
-                tokens_data = json.load(tokens_file)
-            # Create a mapping dictionary: {token_id: token_ascii}
-            tokens_mapping = {
-                token["token_id"]: token["token_ascii"] for token in tokens_data
-            }
-
-            return tokens_mapping
+            return FormatTokenName.load_token_index().names
         except Exception as e:
             print(e)
 
         return {}
+
+
+if __name__ == "__main__":
+    # Precompile the snapshot at deploy time: python -m src.bot.utils.mapping_token_name
+    tokens = FormatTokenName.build_snapshot()
+    print(f"Wrote {len(tokens['token_id'])} tokens to {TOKENS_SNAPSHOT_PATH}")
@@ -0,0 +1,46 @@
+import time
+
+from config.settings import FEAR_GREED_HISTORY_SIZE, TRENDING_HISTORY_SIZE, TRENDING_HISTORY_MAX_AGE
+from src.bot.utils.shared_cache import shared_cache
+
+
+class MarketHistory:
+    """Rolling market samples kept in the shared cache, used to draw charts over time"""
+
+    @staticmethod
+    def record_fear_greed(value):
+        """Append a fear & greed value (0-100) with the current timestamp"""
+        def append(history):
+            history = (history or []) + [[int(time.time()), value]]
+            return history[-FEAR_GREED_HISTORY_SIZE:]
+
+        shared_cache.update("history:fear_greed", append)
+
+    @staticmethod
+    def fear_greed_series():
+        """[[timestamp, value], ...] oldest first"""
+        return shared_cache.get("history:fear_greed", [])
+
+    @staticmethod
+    def record_trending(period, pairs):
+        """Append one [timestamp, price, volume] sample per trending token"""
+        now = int(time.time())
+
+        def append(history):
+            history = history or {}
+            for pair in pairs:
+                samples = history.get(pair.token_id, []) + [
+                    [now, pair.current_period_closing_price, pair.current_period_volume]
+                ]
+                history[pair.token_id] = samples[-TRENDING_HISTORY_SIZE:]
+            # Forget tokens that dropped out of the trending list long ago
+            oldest = now - TRENDING_HISTORY_MAX_AGE
+            return {token_id: samples for token_id, samples in history.items() if samples[-1][0] >= oldest}
+
+        shared_cache.update(f"history:trending:{period}", append)
+
+    @staticmethod
+    def trending_series(period, token_ids):
+        """{token_id: [[timestamp, price, volume], ...]} for the requested tokens"""
+        history = shared_cache.get(f"history:trending:{period}", {})
+        return {token_id: history.get(token_id, []) for token_id in token_ids}
@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from config.settings import BATCH_WINDOW, BATCH_MAX_SIZE, BATCH_WAIT_TIMEOUT
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent lookups from different callers into one bulk request
+
+    The first caller of a batch waits `window` seconds for others to join, then
+    sends every distinct key collected so far through `fetch_many(keys)`, which
+    must return a {key: result} dict. Keys already queued or in flight are shared
+    instead of being requested twice. A batch is sent early once it reaches
+    `max_batch` keys. If a bulk request fails with an error that `is_key_error`
+    attributes to the keys (e.g. a 400 for one malformed key), the batch is split
+    and retried so the error only reaches the callers of the key(s) that caused
+    it; other errors (timeouts, outages) fail the whole batch at once.
+    """
+
+    def __init__(self, fetch_many, window: float = BATCH_WINDOW, max_batch: int = BATCH_MAX_SIZE,
+                 wait_timeout: float = BATCH_WAIT_TIMEOUT, is_key_error=lambda error: True):
+        self.fetch_many = fetch_many
+        self.window = window
+        self.max_batch = max_batch
+        self.wait_timeout = wait_timeout
+        self.is_key_error = is_key_error
+        self._lock = threading.Lock()
+        self._futures = {}  # key -> Future, for queued and in-flight keys
+        self._batch = []
+
+    def get_many(self, keys):
+        """
+        Look up `keys` (hashable), blocking until their batch returns
+
+        Returns:
+            dict: {key: result}, with None for keys the upstream did not return
+
+        Raises:
+            Exception: whatever `fetch_many` raised for one of `keys` on its own
+            TimeoutError: if the batch did not return within `wait_timeout` seconds
+        """
+        full_batch = None
+        with self._lock:
+            batch = self._batch
+            leader = not batch
+            futures = {}
+            for key in keys:
+                future = self._futures.get(key)
+                if future is None:
+                    future = self._futures[key] = Future()
+                    batch.append(key)
+                futures[key] = future
+
+            if len(batch) >= self.max_batch:
+                full_batch = self._take_batch(batch)
+
+        if full_batch:
+            self._send(full_batch)
+        elif leader and batch:
+            time.sleep(self.window)
+            with self._lock:
+                batch = self._take_batch(batch)
+            if batch:
+                self._send(batch)
+
+        deadline = time.monotonic() + self.wait_timeout
+        try:
+            return {
+                key: future.result(timeout=max(0.0, deadline - time.monotonic()))
+                for key, future in futures.items()
+            }
+        except FutureTimeoutError:
+            raise TimeoutError(f"Batched lookup timed out after {self.wait_timeout:g}s") from None
+
+    def _take_batch(self, batch):
+        # Called with the lock held; returns None if the batch was already sent
+        if batch is not self._batch:
+            return None
+        self._batch = []
+        return batch
+
+    def _fetch(self, keys):
+        """{key: result or exception}, halving a batch failed by a key error until the failing keys are isolated"""
+        try:
+            results = self.fetch_many(keys)
+            return {key: results.get(key) for key in keys}
+        except Exception as e:
+            if len(keys) == 1 or not self.is_key_error(e):
+                return {key: e for key in keys}
+
+        middle = len(keys) // 2
+        return {**self._fetch(keys[:middle]), **self._fetch(keys[middle:])}
+
+    def _send(self, keys):
+        results = self._fetch(keys)
+
+        with self._lock:
+            futures = [(key, self._futures.pop(key)) for key in keys]
+
+        for key, future in futures:
+            result = results[key]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
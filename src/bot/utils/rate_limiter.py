@@ -0,0 +1,106 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second up to `capacity`"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def consume(self, now: float, amount: float = 1.0) -> bool:
+        """Take `amount` tokens if available, refilling for the time elapsed since the last call"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def is_full(self, now: float) -> bool:
+        return self.tokens + (now - self.updated_at) * self.rate >= self.capacity
+
+
+class RateLimiter:
+    """Keyed token buckets, e.g. one per user id or per chat id"""
+
+    def __init__(self, rate: float, capacity: float, max_keys: int = 10_000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key) -> bool:
+        """Return True if `key` still has budget, consuming one token"""
+        if self.rate <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity, now)
+            return bucket.consume(now)
+
+    def _prune(self, now: float):
+        # Full buckets carry no state worth keeping, a new one would be identical
+        for key in [key for key, bucket in self._buckets.items() if bucket.is_full(now)]:
+            del self._buckets[key]
+
+
+class CommandCollapser:
+    """Collapse identical commands into a single execution
+
+    The first caller of `claim(key)` wins and runs the command; repeated claims
+    for the same key are rejected while that execution is still running and for
+    `window` seconds after it started. An execution still unreleased after
+    `max_in_flight` seconds is treated as hung and no longer blocks the key.
+    """
+
+    def __init__(self, window: float, max_in_flight: float = 60, max_keys: int = 10_000):
+        self.window = window
+        self.max_in_flight = max_in_flight
+        self.max_keys = max_keys
+        self._claims = {}  # key -> [started_at, in_flight]
+        self._lock = threading.Lock()
+
+    def claim(self, key) -> bool:
+        if self.window <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            claim = self._claims.get(key)
+            if claim is not None and not self._expired(claim, now):
+                return False
+
+            if len(self._claims) >= self.max_keys:
+                self._prune(now)
+            self._claims[key] = [now, True]
+            return True
+
+    def release(self, key):
+        with self._lock:
+            claim = self._claims.get(key)
+            if claim is not None:
+                claim[1] = False
+
+    def _expired(self, claim, now: float) -> bool:
+        started_at, in_flight = claim
+        age = now - started_at
+        return age >= self.max_in_flight if in_flight else age >= self.window
+
+    def _prune(self, now: float):
+        for key in [key for key, claim in self._claims.items() if self._expired(claim, now)]:
+            del self._claims[key]
@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import threading
+import time
+
+from config.settings import SHARED_CACHE_PATH
+from src.bot.models.base import loads, dumps, decode_json
+
+
+class SharedCache:
+    """
+    Small key/value cache shared by every bot process on the host
+
+    Values (plain data or response models) are stored JSON-encoded in a SQLite database in WAL mode, so any
+    number of processes can read while one writes. Connections are opened
+    lazily per thread and per process (connections must not cross a fork).
+    """
+
+    def __init__(self, path: str = SHARED_CACHE_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str, default=None, model_type=None):
+        """Return the value under `key`, decoded straight into `model_type` if given"""
+        row = self.connection().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return default
+        return decode_json(model_type, row[0]) if model_type else loads(row[0])
+
+    def set(self, key: str, value, ttl: float = None):
+        """Store `value` under `key`, expiring after `ttl` seconds (never if None)"""
+        expires_at = time.time() + ttl if ttl else None
+        self.connection().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, dumps(value), expires_at)
+        )
+
+    def update(self, key: str, update, ttl: float = None):
+        """
+        Atomically replace the value under `key` with `update(current_value)`,
+        where current_value is None if missing or expired. Returns the new value.
+        """
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            value = update(self.get(key))
+            self.set(key, value, ttl)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def delete(self, key: str):
+        self.connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def get_or_fetch(self, key: str, ttl: float, fetch, model_type=None):
+        """
+        Return the cached value for `key`, calling `fetch()` on a miss.
+        With `model_type`, cached values are decoded back into that model.
+
+        Error strings returned by the services ("Error: ...") are passed
+        through without being cached.
+        """
+        value = self.get(key, model_type=model_type)
+        if value is not None:
+            return value
+
+        value = fetch()
+        if value is not None and not isinstance(value, str):
+            self.set(key, value, ttl)
+        return value
+
+    def purge_expired(self):
+        """Delete expired rows, get() skips them but never removes them (run periodically by one process)"""
+        self.connection().execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+
+
+shared_cache = SharedCache()
@@ -0,0 +1,35 @@
+import marshal
+import os
+
+
+def read_snapshot(path, version):
+    """
+    Read a marshal snapshot written by write_snapshot
+
+    Returns:
+        dict: The snapshot's fields, or None if the file is missing, unreadable
+        or was written for another layout `version`.
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            snapshot = marshal.load(snapshot_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != version:
+        return None
+    return snapshot
+
+
+def write_snapshot(path, version, **fields):
+    """
+    Atomically replace the marshal snapshot at `path` with `fields`, tagged with the
+    layout `version` so readers ignore snapshots from an older layout.
+    Raises OSError if the snapshot cannot be written.
+    """
+    snapshot = dict(fields, version=version)
+
+    # Write to a temp file first so a concurrent reader never sees a partial snapshot
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as snapshot_file:
+        marshal.dump(snapshot, snapshot_file)
+    os.replace(tmp_path, path)
@@ -0,0 +1,129 @@
+import bisect
+import string
+
+HEX_DIGITS = set(string.hexdigits)
+
+# Cardano policy ids are 28 bytes, so a raw token id is at least 56 hex characters
+MIN_TOKEN_ID_LENGTH = 56
+
+
+class TokenIndex:
+    """
+    In-memory prefix and fuzzy index over token tickers and names
+
+    Built once from the token registry columns (see FormatTokenName.load_tokens)
+    and read-only afterwards, so it can be shared by handler threads and swapped
+    out wholesale when the registry changes.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.ids = tokens["token_id"]
+        self.tickers = tokens["ticker"]
+        self.names = dict(zip(tokens["token_id"], tokens["token_ascii"]))
+        self.verified = tokens["is_verified"]
+
+        entries = set()
+        for row, (ticker, name) in enumerate(zip(tokens["ticker"], tokens["token_ascii"])):
+            for key in (ticker, name):
+                key = self._normalize(key)
+                if key:
+                    entries.add((key, row))
+
+        entries = sorted(entries)
+        self._keys = [key for key, __ in entries]
+        self._rows = [row for __, row in entries]
+
+        self._exact = {}
+        self._grams = {}
+        for key, row in entries:
+            self._exact.setdefault(key, []).append(row)
+            for gram in self._bigrams(key):
+                self._grams.setdefault(gram, set()).add(row)
+        for rows in self._exact.values():
+            rows.sort(key=self._rank)
+        self._ranked = sorted(range(len(self.ids)), key=self._rank)
+
+    @staticmethod
+    def _normalize(text):
+        return (text or "").strip().lower().lstrip("$")
+
+    @staticmethod
+    def _bigrams(key):
+        return {key[i:i + 2] for i in range(len(key) - 1)} if len(key) > 1 else {key}
+
+    def _rank(self, row):
+        # Verified tokens first, then shorter tickers (closer to what was typed)
+        ticker = self.tickers[row] or ""
+        return not self.verified[row], not ticker, len(ticker), ticker
+
+    def __len__(self):
+        return len(self.ids)
+
+    def record(self, row):
+        return {
+            "token_id": self.ids[row],
+            "ticker": self.tickers[row],
+            "token_ascii": self.names[self.ids[row]],
+            "is_verified": bool(self.verified[row])
+        }
+
+    def search(self, query, limit=10):
+        """
+        Find tokens by ticker or name: exact matches, then prefix matches, then
+        fuzzy (shared character pairs) matches, each ranked verified-first.
+
+        Returns:
+            list: Row numbers, use `record(row)` for the token fields
+        """
+        query = self._normalize(query)
+        if not query:
+            return self._ranked[:limit]
+
+        results = list(self._exact.get(query, ()))
+        seen = set(results)
+
+        # Keys are sorted, so prefix matches are one contiguous run; shortest matching key wins
+        start = bisect.bisect_left(self._keys, query)
+        prefix_lengths = {}
+        for i in range(start, len(self._keys)):
+            key = self._keys[i]
+            if not key.startswith(query):
+                break
+            row = self._rows[i]
+            if row not in seen and len(key) < prefix_lengths.get(row, len(key) + 1):
+                prefix_lengths[row] = len(key)
+        seen.update(prefix_lengths)
+        results.extend(sorted(
+            prefix_lengths, key=lambda row: (not self.verified[row], prefix_lengths[row]) + self._rank(row)[1:]
+        ))
+
+        if len(results) < limit and len(query) > 1:
+            grams = self._bigrams(query)
+            scores = {}
+            for gram in grams:
+                for row in self._grams.get(gram, ()):
+                    if row not in seen:
+                        scores[row] = scores.get(row, 0) + 1
+            # Require at least half of the query's character pairs to match
+            threshold = (len(grams) + 1) // 2
+            fuzzy_rows = [row for row, score in scores.items() if score >= threshold]
+            fuzzy_rows.sort(key=lambda row: (-scores[row],) + self._rank(row))
+            results.extend(fuzzy_rows)
+
+        return results[:limit]
+
+    def resolve(self, symbol):
+        """
+        Resolve a ticker or name to a token id for DexHunter ("ADA" is the empty id).
+        Raw token ids are returned unchanged, unknown symbols return None.
+        """
+        if len(symbol) >= MIN_TOKEN_ID_LENGTH and set(symbol) <= HEX_DIGITS:
+            return symbol
+
+        key = self._normalize(symbol)
+        if key in ("ada", "lovelace"):
+            return ""
+
+        rows = self._exact.get(key)
+        return self.ids[rows[0]] if rows else None
@@ -0,0 +1,134 @@
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from telebot import types
+
+from config.settings import (
+    WEBHOOK_URL, WEBHOOK_LISTEN, WEBHOOK_PORT, WEBHOOK_SECRET, WORKER_PROCESSES
+)
+from .bot import create_bot, start_background_services
+
+logger = logging.getLogger(__name__)
+
+
+def shard_for_update(update: dict, shards: int) -> int:
+    """Pick the worker for an update so every update of a chat lands on the same process"""
+    key = update.get('update_id', 0)
+    for field in ('message', 'edited_message', 'channel_post', 'edited_channel_post'):
+        if field in update:
+            key = update[field]['chat']['id']
+            break
+    else:
+        callback = update.get('callback_query')
+        if callback:
+            message = callback.get('message')
+            key = message['chat']['id'] if message else callback['from']['id']
+        else:
+            for value in update.values():
+                if isinstance(value, dict) and 'from' in value:
+                    key = value['from']['id']
+                    break
+    return key % shards
+
+
+def _run_shard(shard, queue):
+    """Worker process: its own bot, handlers and channel worker, fed by the webhook front"""
+    bot = create_bot()
+
+    # Every process competes for the channel worker and token sync leases, only the leaders
+    # post and poll upstream; token sync followers reload the leader's snapshot
+    stop_background_services = start_background_services(bot)
+
+    logger.info(f"Shard {shard} started")
+    while True:
+        payload = queue.get()
+        if payload is None:
+            break
+        try:
+            bot.process_new_updates([types.Update.de_json(payload)])
+        except Exception as e:
+            logger.error(f"Shard {shard} failed to process update: {str(e)}")
+
+    stop_background_services()
+
+
+class WebhookServer:
+    """Receive Telegram webhook updates and shard them across worker processes by chat"""
+
+    def __init__(self, processes: int = WORKER_PROCESSES):
+        self.processes = max(1, processes)
+        self.queues = [multiprocessing.Queue() for _ in range(self.processes)]
+        self.workers = [None] * self.processes
+        self.path = (urlparse(WEBHOOK_URL).path if WEBHOOK_URL else '') or '/'
+
+    def _spawn(self, shard):
+        process = multiprocessing.Process(
+            target=_run_shard, args=(shard, self.queues[shard]), name=f"bot-shard-{shard}", daemon=True
+        )
+        process.start()
+        self.workers[shard] = process
+
+    def _make_handler(self):
+        server = self
+
+        class UpdateHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != server.path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if WEBHOOK_SECRET and self.headers.get('X-Telegram-Bot-Api-Secret-Token') != WEBHOOK_SECRET:
+                    self.send_response(403)
+                    self.end_headers()
+                    return
+
+                payload = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8')
+                try:
+                    shard = shard_for_update(json.loads(payload), server.processes)
+                except (ValueError, KeyError, TypeError):
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                server.queues[shard].put(payload)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return UpdateHandler
+
+    def serve_forever(self):
+        if not WEBHOOK_URL:
+            raise ValueError("WEBHOOK_URL must be set to run in webhook mode")
+
+        for shard in range(self.processes):
+            self._spawn(shard)
+
+        bot = create_bot()
+        bot.remove_webhook()
+        bot.set_webhook(url=WEBHOOK_URL, secret_token=WEBHOOK_SECRET)
+
+        httpd = ThreadingHTTPServer((WEBHOOK_LISTEN, WEBHOOK_PORT), self._make_handler())
+        logger.info(f"Webhook listening on {WEBHOOK_LISTEN}:{WEBHOOK_PORT} with {self.processes} workers")
+
+        server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            # Restart crashed shards, queued updates are picked up by the replacement
+            while True:
+                for shard, process in enumerate(self.workers):
+                    if not process.is_alive():
+                        logger.error(f"Shard {shard} exited with {process.exitcode}, restarting")
+                        self._spawn(shard)
+                time.sleep(5)
+        finally:
+            httpd.shutdown()
+            for queue in self.queues:
+                queue.put(None)